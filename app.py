@@ -1,10 +1,11 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import asyncio
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.subplots as sp
 from datetime import datetime, timedelta
 import os
 import sys
@@ -15,19 +16,20 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 from src.binance_client import BinanceClient
 from src.websocket_client import WebSocketClient
 from src.technical_indicators import TechnicalIndicators
-from src.data_processor import DataProcessor
+from src.data_processor import DataProcessor, SUM_DTYPES
 from src.logger import setup_logger
 from src.validation import Validator
 from src.market_orders import MarketOrderHandler
 from src.limit_orders import LimitOrderHandler
-from src.advanced.oco import OCOOrderHandler
-from src.advanced.twap import TWAPOrderHandler
-from src.advanced.stop_limit import StopLimitOrderHandler
-from src.advanced.grid_orders import GridOrderHandler
 
 # Initialize logger
 logger = setup_logger()
 
+HISTORICAL_DATA_FILE = "attached_assets/historical_data_1753604303963.csv"
+FEAR_GREED_FILE = "attached_assets/fear_greed_index_1753604296223.csv"
+LOG_FILE = "bot.log"
+LOG_TAIL_BYTES = 65536
+
 # Initialize session state
 if 'binance_client' not in st.session_state:
     st.session_state.binance_client = None
@@ -35,8 +37,6 @@ if 'websocket_client' not in st.session_state:
     st.session_state.websocket_client = None
 if 'data_processor' not in st.session_state:
     st.session_state.data_processor = DataProcessor()
-if 'tech_indicators' not in st.session_state:
-    st.session_state.tech_indicators = TechnicalIndicators()
 if 'validator' not in st.session_state:
     st.session_state.validator = Validator()
 if 'live_data' not in st.session_state:
@@ -54,8 +54,15 @@ def initialize_binance_client():
             st.error("Binance API credentials not found in environment variables")
             return False
             
+        close_binance_client()
         st.session_state.binance_client = BinanceClient(api_key, api_secret)
         
+        # Advanced handlers are only needed once a client exists
+        from src.advanced.oco import OCOOrderHandler
+        from src.advanced.twap import TWAPOrderHandler
+        from src.advanced.stop_limit import StopLimitOrderHandler
+        from src.advanced.grid_orders import GridOrderHandler
+        
         # Initialize order handlers
         st.session_state.order_handlers = {
             'market': MarketOrderHandler(st.session_state.binance_client),
@@ -74,6 +81,18 @@ def initialize_binance_client():
         logger.error(f"Failed to initialize Binance client: {str(e)}")
         return False
 
+def close_binance_client():
+    """Stop the current client and its order handlers' background work"""
+    for handler in st.session_state.order_handlers.values():
+        close = getattr(handler, 'close', None)
+        if close is not None:
+            close()
+    st.session_state.order_handlers = {}
+    
+    if st.session_state.binance_client is not None:
+        st.session_state.binance_client.close()
+        st.session_state.binance_client = None
+
 def start_websocket():
     """Start WebSocket connection for live data"""
     try:
@@ -88,6 +107,88 @@ def start_websocket():
         st.error(f"Failed to start WebSocket: {str(e)}")
         logger.error(f"Failed to start WebSocket: {str(e)}")
 
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_ticker(_client, symbol):
+    """Fetch 24hr ticker, memoized across reruns for a few seconds"""
+    return _client.get_ticker(symbol)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_klines(_client, symbol, timeframe, limit):
+    """Fetch klines, memoized across reruns until the TTL expires"""
+    return _client.get_klines(symbol, timeframe, limit=limit)
+
+def _klines_to_arrays(klines):
+    """Split raw kline rows into timestamp and OHLCV NumPy arrays in one pass"""
+    arr = np.asarray(klines, dtype=object)
+    timestamps = arr[:, 0].astype(np.int64).astype('datetime64[ms]')
+    ohlcv = arr[:, 1:6].astype(np.float64)
+    
+    return (timestamps,) + tuple(ohlcv.T)
+
+@st.cache_resource
+def _get_tech_indicators():
+    """Shared technical indicators calculator for all sessions"""
+    return TechnicalIndicators()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _calculate_indicators(_df, symbol, timeframe, last_timestamp, last_close, length):
+    """Calculate indicators only when the latest candle opens or moves for (symbol, timeframe)"""
+    return _get_tech_indicators().calculate_all_indicators(_df)
+
+def _file_mtime(file_path):
+    """Return file modification time used as a cache fingerprint"""
+    return os.path.getmtime(file_path) if os.path.exists(file_path) else None
+
+@st.cache_data(show_spinner=False)
+def _load_historical_analysis(file_path, file_mtime):
+    """Load historical trades and their aggregations once per file version"""
+    historical_data = st.session_state.data_processor.load_historical_data(file_path)
+    
+    if historical_data is None or historical_data.empty:
+        return historical_data, None, None
+    
+    # Totals are shown to the cent, so aggregate the float32 columns as float64
+    amounts = historical_data.astype(SUM_DTYPES)
+    
+    # Group by coin
+    coin_analysis = amounts.groupby('Coin', sort=False, observed=True).agg(
+        count=('Size USD', 'count'),
+        sum=('Size USD', 'sum'),
+        mean=('Size USD', 'mean'),
+        pnl=('Closed PnL', 'sum')
+    )
+    
+    # Time-based analysis on a DatetimeIndex using the column created in data processor
+    daily_analysis = (
+        amounts.dropna(subset=['DateTime'])
+        .set_index('DateTime')
+        .sort_index()
+        .resample('D')[['Size USD', 'Closed PnL']]
+        .sum()
+    )
+    
+    return historical_data, coin_analysis, daily_analysis
+
+@st.cache_data(show_spinner=False)
+def _load_fear_greed_data(file_path, file_mtime):
+    """Load Fear & Greed data once per file version"""
+    return st.session_state.data_processor.load_fear_greed_data(file_path)
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _read_log_tail(file_path, file_mtime, file_size, max_bytes=LOG_TAIL_BYTES):
+    """Read only the last max_bytes of the log file, starting at a full line"""
+    with open(file_path, "rb") as f:
+        f.seek(max(0, file_size - max_bytes))
+        tail = f.read()
+    
+    # Drop the leading partial line when we started mid-file
+    if file_size > max_bytes:
+        newline = tail.find(b"\n")
+        if newline != -1:
+            tail = tail[newline + 1:]
+    
+    return tail.decode("utf-8", errors="replace")
+
 def main():
     st.set_page_config(
         page_title="Binance Futures Trading Bot",
@@ -115,7 +216,8 @@ def main():
         else:
             st.error("❌ Binance Client Not Connected")
         
-        if st.session_state.websocket_client and st.session_state.websocket_client.is_connected():
+        ws_client = st.session_state.websocket_client
+        if ws_client is not None and ws_client.is_running:
             st.success("✅ WebSocket Connected")
         else:
             st.error("❌ WebSocket Not Connected")
@@ -148,8 +250,12 @@ def main():
     with tab6:
         logs_page()
 
+@st.fragment
 def dashboard_page():
     """Main dashboard with live data and charts"""
+    import plotly.graph_objects as go
+    import plotly.subplots as sp
+    
     st.header("📊 Live Market Dashboard")
     
     # Symbol selection
@@ -163,47 +269,62 @@ def dashboard_page():
     
     with col3:
         if st.button("🔄 Refresh Data"):
-            st.rerun()
+            st.rerun(scope="fragment")
     
     if st.session_state.binance_client:
         try:
-            # Get live market data
-            ticker = st.session_state.binance_client.get_ticker(symbol)
-            klines = st.session_state.binance_client.get_klines(symbol, timeframe, limit=100)
+            # Get live market data, overlapping the two REST round-trips; the workers
+            # run under this script's context so the cached fetches attach to the session
+            client = st.session_state.binance_client
+            ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(
+                max_workers=2,
+                initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+            ) as executor:
+                ticker_future = executor.submit(_fetch_ticker, client, symbol)
+                klines_future = executor.submit(_fetch_klines, client, symbol, timeframe, 100)
+                ticker = ticker_future.result()
+                klines = klines_future.result()
             
             if ticker and klines:
                 # Display current price info
+                last_price, change_percent, high_price, low_price, volume = map(float, (
+                    ticker['lastPrice'],
+                    ticker['priceChangePercent'],
+                    ticker['highPrice'],
+                    ticker['lowPrice'],
+                    ticker['volume']
+                ))
+                
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
                     st.metric(
                         "Current Price", 
-                        f"${float(ticker['lastPrice']):.4f}",
-                        f"{float(ticker['priceChangePercent']):.2f}%"
+                        f"${last_price:.4f}",
+                        f"{change_percent:.2f}%"
                     )
                 
                 with col2:
-                    st.metric("24h High", f"${float(ticker['highPrice']):.4f}")
+                    st.metric("24h High", f"${high_price:.4f}")
                 
                 with col3:
-                    st.metric("24h Low", f"${float(ticker['lowPrice']):.4f}")
+                    st.metric("24h Low", f"${low_price:.4f}")
                 
                 with col4:
-                    st.metric("24h Volume", f"{float(ticker['volume']):.2f}")
+                    st.metric("24h Volume", f"{volume:.2f}")
                 
-                # Create candlestick chart with technical indicators
-                df = pd.DataFrame(klines, columns=[
-                    'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                    'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                    'taker_buy_quote', 'ignore'
-                ])
-                
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                for col in ['open', 'high', 'low', 'close', 'volume']:
-                    df[col] = df[col].astype(float)
+                # Chart straight from arrays; indicators only need a lean frame
+                timestamps, open_, high, low, close, volume = _klines_to_arrays(klines)
+                df = pd.DataFrame({
+                    'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume
+                })
                 
-                # Calculate technical indicators
-                indicators = st.session_state.tech_indicators.calculate_all_indicators(df)
+                # Calculate technical indicators; the forming candle's close is part of
+                # the key so RSI/MACD/BB track it like the price trace does
+                indicators = _calculate_indicators(
+                    df, symbol, timeframe, timestamps[-1], float(close[-1]), len(df)
+                )
                 
                 # Create subplots
                 fig = sp.make_subplots(
@@ -214,114 +335,110 @@ def dashboard_page():
                     row_heights=[0.6, 0.2, 0.2]
                 )
                 
+                # Collect traces and submit them to the figure in one call
+                traces = []
+                rows = []
+                
                 # Candlestick chart
-                fig.add_trace(
-                    go.Candlestick(
-                        x=df['timestamp'],
-                        open=df['open'],
-                        high=df['high'],
-                        low=df['low'],
-                        close=df['close'],
-                        name=symbol
-                    ),
-                    row=1, col=1
-                )
+                traces.append(go.Candlestick(
+                    x=timestamps,
+                    open=open_,
+                    high=high,
+                    low=low,
+                    close=close,
+                    name=symbol
+                ))
+                rows.append(1)
                 
                 # Add moving averages
                 if 'sma_20' in indicators:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df['timestamp'],
-                            y=indicators['sma_20'],
-                            name='SMA 20',
-                            line=dict(color='orange')
-                        ),
-                        row=1, col=1
-                    )
+                    traces.append(go.Scatter(
+                        x=timestamps,
+                        y=indicators['sma_20'].values,
+                        name='SMA 20',
+                        line=dict(color='orange')
+                    ))
+                    rows.append(1)
                 
                 if 'ema_20' in indicators:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df['timestamp'],
-                            y=indicators['ema_20'],
-                            name='EMA 20',
-                            line=dict(color='yellow')
-                        ),
-                        row=1, col=1
-                    )
+                    traces.append(go.Scatter(
+                        x=timestamps,
+                        y=indicators['ema_20'].values,
+                        name='EMA 20',
+                        line=dict(color='yellow')
+                    ))
+                    rows.append(1)
                 
                 # Bollinger Bands
                 if all(key in indicators for key in ['bb_upper', 'bb_middle', 'bb_lower']):
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df['timestamp'],
-                            y=indicators['bb_upper'],
-                            name='BB Upper',
-                            line=dict(color='gray', dash='dash')
-                        ),
-                        row=1, col=1
-                    )
+                    traces.append(go.Scatter(
+                        x=timestamps,
+                        y=indicators['bb_upper'].values,
+                        name='BB Upper',
+                        line=dict(color='gray', dash='dash')
+                    ))
+                    rows.append(1)
                     
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df['timestamp'],
-                            y=indicators['bb_lower'],
-                            name='BB Lower',
-                            line=dict(color='gray', dash='dash'),
-                            fill='tonexty'
-                        ),
-                        row=1, col=1
-                    )
+                    traces.append(go.Scatter(
+                        x=timestamps,
+                        y=indicators['bb_lower'].values,
+                        name='BB Lower',
+                        line=dict(color='gray', dash='dash'),
+                        fill='tonexty'
+                    ))
+                    rows.append(1)
                 
                 # RSI
                 if 'rsi' in indicators:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df['timestamp'],
-                            y=indicators['rsi'],
-                            name='RSI',
-                            line=dict(color='purple')
-                        ),
-                        row=2, col=1
-                    )
-                    
-                    # RSI overbought/oversold lines
-                    fig.add_hline(y=70, line_dash="dash", line_color="red", row=2, col=1)
-                    fig.add_hline(y=30, line_dash="dash", line_color="green", row=2, col=1)
+                    traces.append(go.Scatter(
+                        x=timestamps,
+                        y=indicators['rsi'].values,
+                        name='RSI',
+                        line=dict(color='purple')
+                    ))
+                    rows.append(2)
                 
                 # MACD
                 if all(key in indicators for key in ['macd', 'macd_signal', 'macd_histogram']):
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df['timestamp'],
-                            y=indicators['macd'],
-                            name='MACD',
-                            line=dict(color='blue')
-                        ),
-                        row=3, col=1
-                    )
+                    traces.append(go.Scatter(
+                        x=timestamps,
+                        y=indicators['macd'].values,
+                        name='MACD',
+                        line=dict(color='blue')
+                    ))
+                    rows.append(3)
                     
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df['timestamp'],
-                            y=indicators['macd_signal'],
-                            name='Signal',
-                            line=dict(color='red')
-                        ),
-                        row=3, col=1
-                    )
+                    traces.append(go.Scatter(
+                        x=timestamps,
+                        y=indicators['macd_signal'].values,
+                        name='Signal',
+                        line=dict(color='red')
+                    ))
+                    rows.append(3)
                     
-                    fig.add_trace(
-                        go.Bar(
-                            x=df['timestamp'],
-                            y=indicators['macd_histogram'],
-                            name='Histogram',
-                            marker_color='green'
-                        ),
-                        row=3, col=1
-                    )
+                    traces.append(go.Bar(
+                        x=timestamps,
+                        y=indicators['macd_histogram'].values,
+                        name='Histogram',
+                        marker_color='green'
+                    ))
+                    rows.append(3)
                 
-                fig.update_layout(height=800, showlegend=True, xaxis_rangeslider_visible=False)
+                fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
+                
+                # RSI overbought/oversold lines on the second subplot
+                shapes = []
+                if 'rsi' in indicators:
+                    shapes = [
+                        dict(
+                            type='line', xref='x2 domain', x0=0, x1=1,
+                            yref='y2', y0=level, y1=level,
+                            line=dict(color=color, dash='dash')
+                        )
+                        for level, color in [(70, 'red'), (30, 'green')]
+                    ]
+                
+                fig.update_layout(height=800, showlegend=True, xaxis_rangeslider_visible=False, shapes=shapes)
                 st.plotly_chart(fig, use_container_width=True)
                 
         except Exception as e:
@@ -330,6 +447,7 @@ def dashboard_page():
     else:
         st.warning("Please initialize Binance client first")
 
+@st.fragment
 def trading_page():
     """Basic trading page for market and limit orders"""
     st.header("📈 Basic Trading")
@@ -389,6 +507,7 @@ def trading_page():
             else:
                 st.error("Invalid order parameters")
 
+@st.fragment
 def advanced_orders_page():
     """Advanced orders page"""
     st.header("🔄 Advanced Order Types")
@@ -510,13 +629,19 @@ def advanced_orders_page():
                 st.error(f"Error starting grid trading: {str(e)}")
                 logger.error(f"Error starting grid trading: {str(e)}")
 
+@st.fragment
 def analysis_page():
     """Historical data analysis page"""
+    import plotly.graph_objects as go
+    import plotly.subplots as sp
+    
     st.header("📉 Historical Data Analysis")
     
     # Load historical data
     try:
-        historical_data = st.session_state.data_processor.load_historical_data()
+        historical_data, coin_analysis, daily_analysis = _load_historical_analysis(
+            HISTORICAL_DATA_FILE, _file_mtime(HISTORICAL_DATA_FILE)
+        )
         
         if historical_data is not None and not historical_data.empty:
             st.success(f"Loaded {len(historical_data)} historical trading records")
@@ -529,41 +654,30 @@ def analysis_page():
                 st.metric("Total Trades", f"{total_trades:,}")
             
             with col2:
-                total_volume = historical_data['Size USD'].sum()
+                total_volume = historical_data['Size USD'].astype('float64').sum()
                 st.metric("Total Volume", f"${total_volume:,.2f}")
             
             with col3:
-                avg_trade_size = historical_data['Size USD'].mean()
+                avg_trade_size = historical_data['Size USD'].astype('float64').mean()
                 st.metric("Avg Trade Size", f"${avg_trade_size:.2f}")
             
             with col4:
-                total_pnl = historical_data['Closed PnL'].sum()
+                total_pnl = historical_data['Closed PnL'].astype('float64').sum()
                 st.metric("Total PnL", f"${total_pnl:.2f}")
             
             # Trading patterns analysis
             st.subheader("📊 Trading Patterns")
             
-            # Group by coin
-            coin_analysis = historical_data.groupby('Coin').agg({
-                'Size USD': ['count', 'sum', 'mean'],
-                'Closed PnL': 'sum'
-            }).round(2)
-            
-            st.dataframe(coin_analysis, use_container_width=True)
-            
-            # Time-based analysis using DateTime column created in data processor
-            if 'DateTime' in historical_data.columns:
-                daily_analysis = historical_data.groupby(historical_data['DateTime'].dt.date).agg({
-                    'Size USD': 'sum',
-                    'Closed PnL': 'sum'
-                })
-            else:
-                # Fallback to creating DateTime from Timestamp
-                historical_data['DateTime'] = pd.to_datetime(historical_data['Timestamp'].astype(float), unit='ms', errors='coerce')
-                daily_analysis = historical_data.groupby(historical_data['DateTime'].dt.date).agg({
-                    'Size USD': 'sum',
-                    'Closed PnL': 'sum'
-                })
+            st.dataframe(
+                coin_analysis,
+                use_container_width=True,
+                column_config={
+                    'count': st.column_config.NumberColumn("Trades", format='%d'),
+                    'sum': st.column_config.NumberColumn("Volume", format='$%.2f'),
+                    'mean': st.column_config.NumberColumn("Avg Size", format='$%.2f'),
+                    'pnl': st.column_config.NumberColumn("Closed PnL", format='$%.2f')
+                }
+            )
             
             # Plot daily volume and PnL
             fig = sp.make_subplots(
@@ -573,7 +687,7 @@ def analysis_page():
             )
             
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=daily_analysis.index,
                     y=daily_analysis['Size USD'],
                     name='Daily Volume',
@@ -583,7 +697,7 @@ def analysis_page():
             )
             
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=daily_analysis.index,
                     y=daily_analysis['Closed PnL'],
                     name='Daily PnL',
@@ -602,12 +716,17 @@ def analysis_page():
         st.error(f"Failed to load historical data: {str(e)}")
         logger.error(f"Failed to load historical data: {str(e)}")
 
+@st.fragment
 def sentiment_page():
     """Fear & Greed Index sentiment analysis page"""
+    import plotly.graph_objects as go
+    
     st.header("🧠 Market Sentiment Analysis")
     
     try:
-        fear_greed_data = st.session_state.data_processor.load_fear_greed_data()
+        fear_greed_data = _load_fear_greed_data(
+            FEAR_GREED_FILE, _file_mtime(FEAR_GREED_FILE)
+        )
         
         if fear_greed_data is not None and not fear_greed_data.empty:
             st.success(f"Loaded {len(fear_greed_data)} Fear & Greed Index records")
@@ -648,12 +767,20 @@ def sentiment_page():
                 'Extreme Greed': 'green'
             }
             
-            for classification in colors.keys():
-                subset = fear_greed_data[fear_greed_data['classification'] == classification]
-                if not subset.empty:
-                    fig.add_trace(go.Scatter(
-                        x=pd.to_datetime(subset['date']),
-                        y=subset['value'],
+            # Parse columns into arrays once and slice them with integer code masks
+            dates = fear_greed_data['date'].to_numpy()
+            values = fear_greed_data['value'].to_numpy()
+            codes = pd.Categorical(
+                fear_greed_data['classification'], categories=list(colors.keys())
+            ).codes
+            
+            traces = []
+            for code, classification in enumerate(colors.keys()):
+                mask = codes == code
+                if mask.any():
+                    traces.append(go.Scattergl(
+                        x=dates[mask],
+                        y=values[mask],
                         mode='markers',
                         name=classification,
                         marker=dict(color=colors[classification], size=4),
@@ -661,23 +788,43 @@ def sentiment_page():
                     ))
             
             # Add trend line
-            fig.add_trace(go.Scatter(
-                x=pd.to_datetime(fear_greed_data['date']),
-                y=fear_greed_data['value'],
+            traces.append(go.Scattergl(
+                x=dates,
+                y=values,
                 mode='lines',
                 name='Trend',
                 line=dict(color='black', width=1),
                 opacity=0.5
             ))
             
+            fig.add_traces(traces)
+            
             # Add sentiment zones
-            fig.add_hrect(y0=0, y1=25, fillcolor="red", opacity=0.1, annotation_text="Extreme Fear")
-            fig.add_hrect(y0=25, y1=45, fillcolor="orange", opacity=0.1, annotation_text="Fear")
-            fig.add_hrect(y0=45, y1=55, fillcolor="yellow", opacity=0.1, annotation_text="Neutral")
-            fig.add_hrect(y0=55, y1=75, fillcolor="lightgreen", opacity=0.1, annotation_text="Greed")
-            fig.add_hrect(y0=75, y1=100, fillcolor="green", opacity=0.1, annotation_text="Extreme Greed")
+            zones = [
+                (0, 25, 'red', "Extreme Fear"),
+                (25, 45, 'orange', "Fear"),
+                (45, 55, 'yellow', "Neutral"),
+                (55, 75, 'lightgreen', "Greed"),
+                (75, 100, 'green', "Extreme Greed")
+            ]
+            shapes = [
+                dict(
+                    type='rect', xref='paper', x0=0, x1=1, yref='y', y0=y0, y1=y1,
+                    fillcolor=color, opacity=0.1, layer='below', line_width=0
+                )
+                for y0, y1, color, _ in zones
+            ]
+            annotations = [
+                dict(
+                    xref='paper', x=1, xanchor='right', yref='y', y=y1, yanchor='top',
+                    text=label, showarrow=False
+                )
+                for _, y1, _, label in zones
+            ]
             
             fig.update_layout(
+                shapes=shapes,
+                annotations=annotations,
                 title="Fear & Greed Index Over Time",
                 xaxis_title="Date",
                 yaxis_title="Fear & Greed Index",
@@ -690,16 +837,18 @@ def sentiment_page():
             # Sentiment statistics
             st.subheader("📊 Sentiment Statistics")
             
-            sentiment_stats = fear_greed_data['classification'].value_counts()
+            labels = list(colors.keys())
+            counts = np.bincount(codes[codes >= 0].astype(np.int64), minlength=len(labels))
+            sentiment_stats = pd.Series(counts, index=labels, name='count')
             
             col1, col2 = st.columns(2)
             
             with col1:
                 # Pie chart of sentiment distribution
                 fig_pie = go.Figure(data=[go.Pie(
-                    labels=sentiment_stats.index,
-                    values=sentiment_stats.values,
-                    marker_colors=[colors[label] for label in sentiment_stats.index]
+                    labels=labels,
+                    values=counts,
+                    marker_colors=list(colors.values())
                 )])
                 
                 fig_pie.update_layout(title="Sentiment Distribution")
@@ -715,25 +864,30 @@ def sentiment_page():
         st.error(f"Failed to load Fear & Greed Index data: {str(e)}")
         logger.error(f"Failed to load Fear & Greed Index data: {str(e)}")
 
+@st.fragment
 def logs_page():
     """Trading logs display page"""
     st.header("📋 Trading Logs")
     
     try:
-        if os.path.exists("bot.log"):
-            with open("bot.log", "r") as f:
-                logs = f.read()
+        if os.path.exists(LOG_FILE):
+            log_stat = os.stat(LOG_FILE)
+            logs = _read_log_tail(LOG_FILE, log_stat.st_mtime, log_stat.st_size)
+            
+            if log_stat.st_size > LOG_TAIL_BYTES:
+                st.caption(f"Showing the last {LOG_TAIL_BYTES // 1024} KB of {LOG_FILE}")
             
             st.text_area("Bot Logs", logs, height=600)
             
             if st.button("🔄 Refresh Logs"):
-                st.rerun()
+                st.rerun(scope="fragment")
                 
             if st.button("🗑️ Clear Logs"):
-                with open("bot.log", "w") as f:
+                with open(LOG_FILE, "w") as f:
                     f.write("")
+                _read_log_tail.clear()
                 st.success("Logs cleared")
-                st.rerun()
+                st.rerun(scope="fragment")
         else:
             st.info("No log file found. Logs will appear here once trading begins.")
             
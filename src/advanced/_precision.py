@@ -0,0 +1,24 @@
+"""
+Price and quantity rounding onto a symbol's tick/step grid
+Shared by the advanced order handlers
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+def quantize(x, tick_size=None, rounding=ROUND_HALF_UP):
+    """
+    Format a price or quantity as a fixed-point string on the symbol's tick grid
+    
+    Args:
+        x (float or Decimal): Value to format
+        tick_size (Decimal, optional): Tick or step size; 8 decimals if not known
+        rounding (str): Decimal rounding mode
+    
+    Returns:
+        str: Fixed-point string (never scientific notation)
+    """
+    if not tick_size:
+        return format(x, '.8f').rstrip('0').rstrip('.')
+    value = x if isinstance(x, Decimal) else Decimal(repr(x))
+    value = (value / tick_size).to_integral_value(rounding) * tick_size
+    return format(value.normalize(), 'f')
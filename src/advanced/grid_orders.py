@@ -3,15 +3,22 @@ Grid trading order handler
 Implements automated buy-low/sell-high strategy within a price range
 """
 
+import asyncio
+import itertools
 import time
 import threading
 import math
 from datetime import datetime
+import numpy as np
 from ..logger import setup_logger, log_trade, log_error
 
 logger = setup_logger()
 
 class GridOrderHandler:
+    BATCH_SIZE = 5  # Futures batchOrders limit per request
+    CANCEL_BATCH_SIZE = 10  # Futures batch cancel limit per request
+    STOPPED_GRID_RETENTION = 3600  # Seconds a stopped grid stays queryable
+    
     def __init__(self, binance_client):
         """
         Initialize Grid trading handler
@@ -20,9 +27,17 @@ class GridOrderHandler:
             binance_client: Binance API client instance
         """
         self.client = binance_client
+        # Registry is replaced copy-on-write under _registry_lock so readers never lock;
+        # each grid_config carries its own RLock for mutations inside the grid
         self.active_grids = {}
-        self.grid_counter = 0
+        self._registry_lock = threading.Lock()
+        self._grid_numbers = itertools.count(1)
         self.monitoring_threads = {}
+        self.watchdog_interval = 30
+        
+        # Fills arrive over the shared user data stream; clientOrderId -> (grid_id, level, side)
+        self.user_stream = None
+        self._order_index = {}
         logger.info("Grid trading handler initialized")
     
     def start_grid(self, symbol, upper_price, lower_price, grid_levels, total_quantity,
@@ -43,26 +58,21 @@ class GridOrderHandler:
             str: Grid ID or None if failed
         """
         try:
+            # Fill detection depends on the user data stream
+            if not self._ensure_user_stream():
+                logger.error(f"Cannot start grid for {symbol}: user data stream unavailable")
+                return None
+            
             # Generate unique grid ID
-            self.grid_counter += 1
-            grid_id = f"GRID_{self.grid_counter}_{int(time.time())}"
+            grid_number = next(self._grid_numbers)
+            grid_id = f"GRID_{grid_number}"
             
             # Calculate grid parameters
             price_increment = (upper_price - lower_price) / (grid_levels - 1)
             quantity_per_level = total_quantity / grid_levels
             
-            # Create grid levels
-            grid_levels_data = []
-            for i in range(grid_levels):
-                level_price = lower_price + (i * price_increment)
-                grid_levels_data.append({
-                    'level': i,
-                    'price': level_price,
-                    'quantity': quantity_per_level,
-                    'buy_order_id': None,
-                    'sell_order_id': None,
-                    'filled': False
-                })
+            # Create grid levels as parallel arrays indexed by level; order id 0 means none
+            prices = lower_price + np.arange(grid_levels) * price_increment
             
             # Create grid configuration
             grid_config = {
@@ -76,16 +86,35 @@ class GridOrderHandler:
                 'price_increment': price_increment,
                 'grid_type': grid_type,
                 'take_profit_percentage': take_profit_percentage,
-                'levels': grid_levels_data,
-                'start_time': datetime.now(),
+                '_tp_absolute': (
+                    take_profit_percentage / 100.0 * total_quantity * lower_price
+                    if take_profit_percentage else None
+                ),
+                'prices': prices,
+                'quantities': np.full(grid_levels, quantity_per_level),
+                'buy_ids': np.zeros(grid_levels, dtype=np.int64),
+                'sell_ids': np.zeros(grid_levels, dtype=np.int64),
+                'filled': np.zeros(grid_levels, dtype=bool),
+                'start_time_ns': time.time_ns(),
+                '_start_monotonic': time.monotonic(),
+                '_total_investment': total_quantity * lower_price,
                 'status': 'ACTIVE',
                 'total_profit': 0,
                 'trades_executed': 0,
-                'stop_requested': False
+                'stop_requested': False,
+                'lock': threading.RLock(),
+                '_order_tag': f"g{grid_number:x}-",
+                # Refills only vary side and price; the rest is encoded once
+                '_order_tpl': self.client.encode_params({
+                    'symbol': symbol,
+                    'type': 'LIMIT',
+                    'timeInForce': 'GTC',
+                    'quantity': str(quantity_per_level)
+                })
             }
             
             # Store grid configuration
-            self.active_grids[grid_id] = grid_config
+            self._register_grid(grid_id, grid_config)
             
             # Log grid start
             log_trade(
@@ -98,24 +127,21 @@ class GridOrderHandler:
                 status='STARTED'
             )
             
-            # Place initial grid orders
+            # Place initial grid orders; early fills wait on the lock per batch
             success = self._place_initial_grid_orders(grid_id)
             
             if success:
-                # Start monitoring thread
-                monitor_thread = threading.Thread(
-                    target=self._monitor_grid,
-                    args=(grid_id,),
-                    daemon=True
+                # Schedule the watchdog on the client's shared event loop
+                self.monitoring_threads[grid_id] = self.client.get_event_loop().submit(
+                    self._monitor_grid(grid_id)
                 )
-                monitor_thread.start()
-                self.monitoring_threads[grid_id] = monitor_thread
                 
                 logger.info(f"Grid trading started: {grid_id} - {symbol} with {grid_levels} levels")
                 return grid_id
             else:
                 # Clean up if initial orders failed
-                del self.active_grids[grid_id]
+                self._unregister_grids([grid_id])
+                self._unindex_grid(grid_id)
                 logger.error(f"Failed to place initial grid orders for {grid_id}")
                 return None
                 
@@ -135,9 +161,51 @@ class GridOrderHandler:
             )
             return None
     
+    def _register_grid(self, grid_id, grid_config):
+        """
+        Add a grid to the registry by swapping in an updated copy
+        
+        Args:
+            grid_id (str): Grid identifier
+            grid_config (dict): Grid configuration
+        """
+        with self._registry_lock:
+            grids = dict(self.active_grids)
+            grids[grid_id] = grid_config
+            self.active_grids = grids
+    
+    def _unregister_grids(self, grid_ids):
+        """
+        Remove grids from the registry by swapping in an updated copy
+        
+        Args:
+            grid_ids (list): Grid identifiers to remove
+        """
+        with self._registry_lock:
+            grids = dict(self.active_grids)
+            for grid_id in grid_ids:
+                grids.pop(grid_id, None)
+            self.active_grids = grids
+    
+    def _unindex_grid(self, grid_id):
+        """
+        Stop routing fills for a grid's orders
+        
+        Args:
+            grid_id (str): Grid identifier
+        """
+        # Snapshot first; the user data thread pops entries concurrently
+        for order_id, entry in list(self._order_index.items()):
+            if entry[0] == grid_id:
+                self._order_index.pop(order_id, None)
+    
     def _place_initial_grid_orders(self, grid_id):
         """
-        Place initial grid orders
+        Place initial grid orders in batches of BATCH_SIZE
+        
+        Each batch is sent and recorded under the grid lock so an early fill
+        sees its order ID; the lock is released between batches so fills can
+        be applied while placement continues.
         
         Args:
             grid_id (str): Grid identifier
@@ -156,56 +224,37 @@ class GridOrderHandler:
                 logger.error(f"Could not get market price for {symbol}")
                 return False
             
-            current_price = float(ticker['price'])
+            current_price = float(ticker['lastPrice'])
+            
+            # Determine which orders to place based on current price and grid type
+            prices = grid_config['prices']
+            
+            no_levels = np.zeros(len(prices), dtype=bool)
+            if grid_type == 'NEUTRAL':
+                # Buy orders below current price, sell orders above
+                buy_mask = prices < current_price
+                sell_mask = prices > current_price
+            elif grid_type == 'LONG':
+                # Only place buy orders (accumulation strategy)
+                buy_mask, sell_mask = prices <= current_price, no_levels
+            elif grid_type == 'SHORT':
+                # Only place sell orders (distribution strategy)
+                buy_mask, sell_mask = no_levels, prices >= current_price
+            else:
+                buy_mask = sell_mask = no_levels
+            
+            pending = (
+                [(level, 'BUY') for level in np.flatnonzero(buy_mask).tolist()] +
+                [(level, 'SELL') for level in np.flatnonzero(sell_mask).tolist()]
+            )
             
             successful_orders = 0
-            total_orders_attempted = 0
+            total_orders_attempted = len(pending)
             
-            for level_data in grid_config['levels']:
-                level_price = level_data['price']
-                quantity = level_data['quantity']
-                
-                try:
-                    # Determine which orders to place based on current price and grid type
-                    if grid_type == 'NEUTRAL':
-                        # Place both buy and sell orders
-                        if level_price < current_price:
-                            # Place buy order below current price
-                            buy_order = self._place_grid_order(symbol, 'BUY', quantity, level_price)
-                            if buy_order:
-                                level_data['buy_order_id'] = buy_order.get('orderId')
-                                successful_orders += 1
-                            total_orders_attempted += 1
-                        
-                        if level_price > current_price:
-                            # Place sell order above current price
-                            sell_order = self._place_grid_order(symbol, 'SELL', quantity, level_price)
-                            if sell_order:
-                                level_data['sell_order_id'] = sell_order.get('orderId')
-                                successful_orders += 1
-                            total_orders_attempted += 1
-                    
-                    elif grid_type == 'LONG':
-                        # Only place buy orders (accumulation strategy)
-                        if level_price <= current_price:
-                            buy_order = self._place_grid_order(symbol, 'BUY', quantity, level_price)
-                            if buy_order:
-                                level_data['buy_order_id'] = buy_order.get('orderId')
-                                successful_orders += 1
-                            total_orders_attempted += 1
-                    
-                    elif grid_type == 'SHORT':
-                        # Only place sell orders (distribution strategy)
-                        if level_price >= current_price:
-                            sell_order = self._place_grid_order(symbol, 'SELL', quantity, level_price)
-                            if sell_order:
-                                level_data['sell_order_id'] = sell_order.get('orderId')
-                                successful_orders += 1
-                            total_orders_attempted += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error placing order for grid level {level_data['level']}: {str(e)}")
-                    continue
+            for i in range(0, len(pending), self.BATCH_SIZE):
+                chunk = pending[i:i + self.BATCH_SIZE]
+                with grid_config['lock']:
+                    successful_orders += self._place_grid_batch(grid_id, chunk)
             
             success_rate = successful_orders / total_orders_attempted if total_orders_attempted > 0 else 0
             logger.info(f"Grid initial orders: {successful_orders}/{total_orders_attempted} successful ({success_rate:.1%})")
@@ -216,179 +265,359 @@ class GridOrderHandler:
             logger.error(f"Error placing initial grid orders: {str(e)}")
             return False
     
-    def _place_grid_order(self, symbol, side, quantity, price):
+    def _place_grid_batch(self, grid_id, chunk):
         """
-        Place individual grid order
+        Send one batch of initial grid orders and record their IDs
         
         Args:
-            symbol (str): Trading symbol
+            grid_id (str): Grid identifier
+            chunk (list): (level, side) pairs, at most BATCH_SIZE
+        
+        Returns:
+            int: Number of levels with a live order afterwards
+        """
+        grid_config = self.active_grids[grid_id]
+        symbol = grid_config['symbol']
+        prices = grid_config['prices']
+        quantities = grid_config['quantities']
+        
+        # A fill handled between batches may already have placed some of these levels
+        ids_by_side = {'BUY': grid_config['buy_ids'], 'SELL': grid_config['sell_ids']}
+        already_placed = len(chunk)
+        chunk = [(level, side) for level, side in chunk if not ids_by_side[side][level]]
+        already_placed -= len(chunk)
+        if not chunk:
+            return already_placed
+        
+        # Index by clientOrderId before sending so an early fill still routes
+        client_order_ids = [self.client.next_client_order_id(grid_config['_order_tag']) for _ in chunk]
+        for client_order_id, (level, side) in zip(client_order_ids, chunk):
+            self._order_index[client_order_id] = (grid_id, level, side)
+        
+        orders = [
+            {
+                'symbol': symbol,
+                'side': side,
+                'type': 'LIMIT',
+                'timeInForce': 'GTC',
+                'quantity': str(float(quantities[level])),
+                'price': str(float(prices[level])),
+                'newClientOrderId': client_order_id
+            }
+            for client_order_id, (level, side) in zip(client_order_ids, chunk)
+        ]
+        
+        try:
+            responses = self.client.place_orders_batch(orders)
+        except Exception as e:
+            logger.error(f"Error placing grid order batch: {str(e)}")
+            responses = None
+        
+        if not responses:
+            logger.error(f"Failed to place grid order batch of {len(orders)} for {symbol}")
+            for client_order_id in client_order_ids:
+                self._order_index.pop(client_order_id, None)
+            return already_placed
+        
+        # Responses are positional; failed entries carry code/msg instead of orderId
+        accepted = already_placed
+        for client_order_id, (level, side), response in zip(client_order_ids, chunk, responses):
+            order_id = response.get('orderId')
+            if order_id is None:
+                logger.error(f"Grid level {level} {side} rejected: {response.get('msg')}")
+                self._order_index.pop(client_order_id, None)
+                continue
+            
+            if side == 'BUY':
+                grid_config['buy_ids'][level] = order_id
+            else:
+                grid_config['sell_ids'][level] = order_id
+            accepted += 1
+        
+        return accepted
+    
+    def _place_grid_order(self, grid_id, side, level):
+        """
+        Place individual grid order from the grid's order template
+        
+        Args:
+            grid_id (str): Grid identifier
             side (str): Order side
-            quantity (float): Order quantity
-            price (float): Order price
+            level (int): Grid level index the order belongs to
         
         Returns:
             dict: Order response or None
         """
         try:
-            response = self.client.place_order(
-                symbol=symbol,
-                side=side,
-                order_type='LIMIT',
-                quantity=quantity,
-                price=price,
-                timeInForce='GTC'
+            grid_config = self.active_grids[grid_id]
+            price = float(grid_config['prices'][level])
+            
+            # Index by clientOrderId before sending so an early fill still routes
+            client_order_id = self.client.next_client_order_id(grid_config['_order_tag'])
+            self._order_index[client_order_id] = (grid_id, level, side)
+            
+            response = self.client.place_order_encoded(
+                grid_config['_order_tpl'], side=side, price=price, newClientOrderId=client_order_id
             )
             
             if response:
-                logger.debug(f"Grid order placed: {side} {quantity} {symbol} @ {price}")
+                logger.debug("Grid order placed: %s %s level %d @ %s", side, grid_config['symbol'], level, price)
                 return response
             else:
-                logger.error(f"Failed to place grid order: {side} {quantity} {symbol} @ {price}")
+                self._order_index.pop(client_order_id, None)
+                logger.error(f"Failed to place grid order: {side} {grid_config['symbol']} level {level} @ {price}")
                 return None
                 
         except Exception as e:
             logger.error(f"Error placing grid order: {str(e)}")
             return None
     
-    def _monitor_grid(self, grid_id):
+    def _ensure_user_stream(self):
+        """
+        Start the user data stream if it is not already running
+        
+        Returns:
+            bool: True if the stream is connected
+        """
+        self.user_stream = self.client.get_user_data_stream()
+        if self.user_stream is None:
+            return False
+        self.user_stream.add_listener(self._on_user_event)
+        return True
+    
+    def _on_user_event(self, event):
+        """
+        Route order fills from the user data stream to their grid level
+        
+        Args:
+            event (dict): User data stream event
+        """
+        try:
+            if event.get('e') != 'ORDER_TRADE_UPDATE':
+                return
+            
+            order = event['o']
+            if order.get('X') != 'FILLED':
+                return
+            
+            entry = self._order_index.pop(order.get('c'), None)
+            if entry is None:
+                return
+            
+            # Refills are REST calls; keep them off the stream thread every handler shares
+            self.client.io_executor.submit(self._handle_fill, *entry)
+                    
+        except Exception as e:
+            logger.error("Error handling grid order update: %s", e)
+    
+    def _handle_fill(self, grid_id, level, side):
+        """
+        Apply a filled grid order under its grid lock
+        
+        Args:
+            grid_id (str): Grid identifier
+            level (int): Filled grid level index
+            side (str): Side of the filled order
+        """
+        grid_config = self.active_grids.get(grid_id)
+        if not grid_config:
+            return
+        
+        with grid_config['lock']:
+            if grid_config['status'] != 'ACTIVE':
+                return
+            if side == 'BUY':
+                self._handle_buy_fill(grid_id, level)
+            else:
+                self._handle_sell_fill(grid_id, level)
+    
+    def _reconcile_grid(self, grid_id):
+        """
+        Replay fills the user data stream missed while it was down
+        
+        Orders still indexed to the grid but no longer open are looked up one
+        by one; filled ones are handled as if their update had arrived, and
+        cancelled or expired ones free their level.
+        
+        Args:
+            grid_id (str): Grid identifier
+        
+        Returns:
+            int: Number of fills replayed
+        """
+        grid_config = self.active_grids.get(grid_id)
+        if not grid_config or grid_config['status'] != 'ACTIVE':
+            return 0
+        
+        symbol = grid_config['symbol']
+        
+        # Snapshot before fetching, so an order placed after the fetch isn't taken for closed
+        indexed = [
+            (client_order_id, level, side)
+            for client_order_id, (entry_grid_id, level, side) in list(self._order_index.items())
+            if entry_grid_id == grid_id
+        ]
+        if not indexed:
+            return 0
+        
+        open_orders = self.client.get_open_orders(symbol)
+        if open_orders is None:
+            logger.error(f"Could not reconcile grid {grid_id}: open orders unavailable")
+            return 0
+        open_ids = {order.get('clientOrderId') for order in open_orders}
+        
+        replayed = 0
+        for client_order_id, level, side in indexed:
+            if client_order_id in open_ids:
+                continue
+            
+            order = self.client.get_order_status(symbol, orig_client_order_id=client_order_id)
+            status = order.get('status') if order else None
+            if status not in ('FILLED', 'CANCELED', 'EXPIRED', 'REJECTED'):
+                continue
+            
+            # The reconnected stream may have delivered the update meanwhile; only one path wins the pop
+            if self._order_index.pop(client_order_id, None) is None:
+                continue
+            
+            if status == 'FILLED':
+                self._handle_fill(grid_id, level, side)
+                replayed += 1
+            else:
+                with grid_config['lock']:
+                    order_ids = grid_config['buy_ids'] if side == 'BUY' else grid_config['sell_ids']
+                    if order_ids[level] == order.get('orderId'):
+                        order_ids[level] = 0
+        
+        if replayed:
+            logger.warning(f"Replayed {replayed} fills missed by the user data stream for {grid_id}")
+        return replayed
+    
+    async def _monitor_grid(self, grid_id):
         """
-        Monitor grid orders and manage fills
+        Watchdog for user data stream health
+        
+        After every (re)connect of the stream, by this grid or any other
+        handler, the grid is reconciled against the exchange. Blocking REST
+        work is pushed to the loop's default executor so one slow grid never
+        stalls the others.
         
         Args:
             grid_id (str): Grid identifier
         """
+        loop = asyncio.get_running_loop()
         try:
             grid_config = self.active_grids.get(grid_id)
             if not grid_config:
                 return
             
-            symbol = grid_config['symbol']
             logger.info(f"Grid monitoring started for {grid_id}")
             
+            # The grid's orders were placed on the current connection
+            seen_connections = self.user_stream.connections if self.user_stream is not None else 0
+            
             while grid_config.get('status') == 'ACTIVE' and not grid_config.get('stop_requested'):
                 try:
-                    # Check order status for each level
-                    for level_data in grid_config['levels']:
-                        self._check_level_orders(grid_id, level_data)
+                    # Reconnect if the fill stream dropped
+                    if self.user_stream is None or not self.user_stream.is_running:
+                        logger.warning(f"User data stream down, reconnecting for {grid_id}")
+                        await loop.run_in_executor(None, self._ensure_user_stream)
                     
-                    # Check take profit conditions
-                    if grid_config.get('take_profit_percentage'):
-                        self._check_take_profit(grid_id)
+                    # Fills during the gap were never pushed; fetch them from REST
+                    stream = self.user_stream
+                    if stream is not None and stream.is_running and stream.connections != seen_connections:
+                        seen_connections = stream.connections
+                        await loop.run_in_executor(None, self._reconcile_grid, grid_id)
                     
-                    time.sleep(5)  # Check every 5 seconds
+                    await asyncio.sleep(self.watchdog_interval)
                     
+                except asyncio.CancelledError:
+                    raise
                 except Exception as e:
-                    logger.error(f"Error in grid monitoring iteration: {str(e)}")
+                    logger.error("Error in grid monitoring iteration: %s", e)
                     continue
             
             logger.info(f"Grid monitoring stopped for {grid_id}")
             
+        except asyncio.CancelledError:
+            logger.info(f"Grid monitoring cancelled for {grid_id}")
         except Exception as e:
             logger.error(f"Error in grid monitoring: {str(e)}")
         finally:
-            # Clean up monitoring thread reference
-            if grid_id in self.monitoring_threads:
-                del self.monitoring_threads[grid_id]
+            # Clean up monitoring task reference
+            self.monitoring_threads.pop(grid_id, None)
     
-    def _check_level_orders(self, grid_id, level_data):
-        """
-        Check status of orders for a specific grid level
-        
-        Args:
-            grid_id (str): Grid identifier
-            level_data (dict): Level data
-        """
-        try:
-            grid_config = self.active_grids[grid_id]
-            symbol = grid_config['symbol']
-            
-            # Check buy order
-            if level_data['buy_order_id']:
-                buy_status = self.client.get_order_status(symbol, order_id=level_data['buy_order_id'])
-                if buy_status and buy_status.get('status') == 'FILLED':
-                    self._handle_buy_fill(grid_id, level_data)
-            
-            # Check sell order
-            if level_data['sell_order_id']:
-                sell_status = self.client.get_order_status(symbol, order_id=level_data['sell_order_id'])
-                if sell_status and sell_status.get('status') == 'FILLED':
-                    self._handle_sell_fill(grid_id, level_data)
-                    
-        except Exception as e:
-            logger.error(f"Error checking level orders: {str(e)}")
-    
-    def _handle_buy_fill(self, grid_id, level_data):
+    def _handle_buy_fill(self, grid_id, level):
         """
         Handle buy order fill
         
         Args:
             grid_id (str): Grid identifier
-            level_data (dict): Level data
+            level (int): Filled grid level index
         """
         try:
             grid_config = self.active_grids[grid_id]
-            symbol = grid_config['symbol']
+            prices = grid_config['prices']
+            sell_ids = grid_config['sell_ids']
             
-            logger.info(f"Grid buy order filled: Level {level_data['level']} @ {level_data['price']}")
+            logger.info("Grid buy order filled: Level %d @ %s", level, prices[level])
             
             # Mark level as filled
-            level_data['filled'] = True
+            grid_config['filled'][level] = True
             grid_config['trades_executed'] += 1
             
             # Place corresponding sell order at next level up
-            next_level_index = level_data['level'] + 1
-            if next_level_index < len(grid_config['levels']):
-                next_level = grid_config['levels'][next_level_index]
-                if not next_level['sell_order_id']:
-                    sell_order = self._place_grid_order(
-                        symbol, 'SELL', level_data['quantity'], next_level['price']
-                    )
-                    if sell_order:
-                        next_level['sell_order_id'] = sell_order.get('orderId')
+            next_level = level + 1
+            if next_level < len(prices) and not sell_ids[next_level]:
+                sell_order = self._place_grid_order(grid_id, 'SELL', next_level)
+                if sell_order:
+                    sell_ids[next_level] = sell_order.get('orderId')
             
             # Clear buy order ID
-            level_data['buy_order_id'] = None
+            grid_config['buy_ids'][level] = 0
             
         except Exception as e:
-            logger.error(f"Error handling buy fill: {str(e)}")
+            logger.error("Error handling buy fill: %s", e)
     
-    def _handle_sell_fill(self, grid_id, level_data):
+    def _handle_sell_fill(self, grid_id, level):
         """
         Handle sell order fill
         
         Args:
             grid_id (str): Grid identifier
-            level_data (dict): Level data
+            level (int): Filled grid level index
         """
         try:
             grid_config = self.active_grids[grid_id]
             symbol = grid_config['symbol']
+            prices = grid_config['prices']
+            buy_ids = grid_config['buy_ids']
+            quantity = float(grid_config['quantities'][level])
+            price = float(prices[level])
             
-            logger.info(f"Grid sell order filled: Level {level_data['level']} @ {level_data['price']}")
+            logger.info("Grid sell order filled: Level %d @ %s", level, price)
             
             # Calculate profit
-            price_increment = grid_config['price_increment']
-            quantity = level_data['quantity']
-            profit = price_increment * quantity
-            grid_config['total_profit'] += profit
+            total_profit = grid_config['total_profit'] + grid_config['price_increment'] * quantity
+            grid_config['total_profit'] = total_profit
             grid_config['trades_executed'] += 1
             
+            # Profit only changes here, so the take profit threshold is checked at fill time
+            tp_absolute = grid_config['_tp_absolute']
+            take_profit_hit = bool(tp_absolute) and total_profit >= tp_absolute
+            
             # Mark level as filled
-            level_data['filled'] = True
+            grid_config['filled'][level] = True
             
             # Place corresponding buy order at next level down
-            prev_level_index = level_data['level'] - 1
-            if prev_level_index >= 0:
-                prev_level = grid_config['levels'][prev_level_index]
-                if not prev_level['buy_order_id']:
-                    buy_order = self._place_grid_order(
-                        symbol, 'BUY', level_data['quantity'], prev_level['price']
-                    )
-                    if buy_order:
-                        prev_level['buy_order_id'] = buy_order.get('orderId')
+            prev_level = level - 1
+            if not take_profit_hit and prev_level >= 0 and not buy_ids[prev_level]:
+                buy_order = self._place_grid_order(grid_id, 'BUY', prev_level)
+                if buy_order:
+                    buy_ids[prev_level] = buy_order.get('orderId')
             
             # Clear sell order ID
-            level_data['sell_order_id'] = None
+            grid_config['sell_ids'][level] = 0
             
             log_trade(
                 logger,
@@ -396,38 +625,17 @@ class GridOrderHandler:
                 symbol,
                 'SELL',
                 quantity,
-                price=level_data['price'],
+                price=price,
                 order_id=grid_id,
                 status='PROFIT_REALIZED'
             )
             
-        except Exception as e:
-            logger.error(f"Error handling sell fill: {str(e)}")
-    
-    def _check_take_profit(self, grid_id):
-        """
-        Check take profit conditions
-        
-        Args:
-            grid_id (str): Grid identifier
-        """
-        try:
-            grid_config = self.active_grids[grid_id]
-            take_profit_percentage = grid_config.get('take_profit_percentage')
-            
-            if not take_profit_percentage:
-                return
-            
-            # Calculate profit percentage
-            total_investment = grid_config['total_quantity'] * grid_config['lower_price']
-            profit_percentage = (grid_config['total_profit'] / total_investment) * 100
-            
-            if profit_percentage >= take_profit_percentage:
-                logger.info(f"Take profit triggered for grid {grid_id}: {profit_percentage:.2f}%")
+            if take_profit_hit:
+                logger.info(f"Take profit triggered for grid {grid_id}: {total_profit:.4f}")
                 self.stop_grid(grid_id, reason='TAKE_PROFIT')
-                
+            
         except Exception as e:
-            logger.error(f"Error checking take profit: {str(e)}")
+            logger.error("Error handling sell fill: %s", e)
     
     def stop_grid(self, grid_id, reason='MANUAL'):
         """
@@ -441,47 +649,57 @@ class GridOrderHandler:
             bool: True if stopped successfully
         """
         try:
-            if grid_id not in self.active_grids:
+            grid_config = self.active_grids.get(grid_id)
+            if grid_config is None:
                 logger.error(f"Grid not found: {grid_id}")
                 return False
             
-            grid_config = self.active_grids[grid_id]
-            grid_config['stop_requested'] = True
-            grid_config['status'] = 'STOPPING'
-            
-            symbol = grid_config['symbol']
-            
-            # Cancel all open orders
-            cancelled_orders = 0
-            for level_data in grid_config['levels']:
-                if level_data['buy_order_id']:
-                    cancel_response = self.client.cancel_order(symbol, order_id=level_data['buy_order_id'])
-                    if cancel_response:
-                        cancelled_orders += 1
-                    level_data['buy_order_id'] = None
+            with grid_config['lock']:
+                grid_config['stop_requested'] = True
+                grid_config['status'] = 'STOPPING'
                 
-                if level_data['sell_order_id']:
-                    cancel_response = self.client.cancel_order(symbol, order_id=level_data['sell_order_id'])
-                    if cancel_response:
-                        cancelled_orders += 1
-                    level_data['sell_order_id'] = None
-            
-            grid_config['status'] = 'STOPPED'
-            grid_config['stop_time'] = datetime.now()
-            grid_config['stop_reason'] = reason
-            
-            logger.info(f"Grid {grid_id} stopped ({reason}): {cancelled_orders} orders cancelled")
-            
-            # Log grid stop
-            log_trade(
-                logger,
-                'GRID_STOP',
-                symbol,
-                'GRID',
-                grid_config['total_quantity'],
-                order_id=grid_id,
-                status=f'STOPPED_{reason}'
-            )
+                # Wake the watchdog instead of waiting out its sleep
+                monitor = self.monitoring_threads.get(grid_id)
+                if monitor is not None:
+                    monitor.cancel()
+                
+                symbol = grid_config['symbol']
+                
+                # Stop routing fills to this grid before cancelling
+                self._unindex_grid(grid_id)
+                
+                # Cancel all open orders
+                buy_ids = grid_config['buy_ids']
+                sell_ids = grid_config['sell_ids']
+                order_ids = buy_ids[buy_ids != 0].tolist() + sell_ids[sell_ids != 0].tolist()
+                cancelled_orders = self._cancel_grid_orders(symbol, order_ids)
+                
+                buy_ids[:] = 0
+                sell_ids[:] = 0
+                
+                grid_config['status'] = 'STOPPED'
+                grid_config['stop_time_ns'] = time.time_ns()
+                grid_config['stop_reason'] = reason
+                
+                # Keep stopped grids for a while before cleanup
+                if not grid_config.get('_reap_timer'):
+                    reap_timer = threading.Timer(self.STOPPED_GRID_RETENTION, self._reap, args=(grid_id,))
+                    reap_timer.daemon = True
+                    reap_timer.start()
+                    grid_config['_reap_timer'] = reap_timer
+                
+                logger.info(f"Grid {grid_id} stopped ({reason}): {cancelled_orders} orders cancelled")
+                
+                # Log grid stop
+                log_trade(
+                    logger,
+                    'GRID_STOP',
+                    symbol,
+                    'GRID',
+                    grid_config['total_quantity'],
+                    order_id=grid_id,
+                    status=f'STOPPED_{reason}'
+                )
             
             return True
             
@@ -489,6 +707,34 @@ class GridOrderHandler:
             logger.error(f"Error stopping grid: {str(e)}")
             return False
     
+    def _cancel_grid_orders(self, symbol, order_ids):
+        """
+        Cancel a grid's orders with as few requests as possible
+        
+        Args:
+            symbol (str): Trading symbol
+            order_ids (list): Order IDs owned by the grid
+        
+        Returns:
+            int: Number of orders cancelled
+        """
+        if not order_ids:
+            return 0
+        
+        # If the grid owns every open order on the symbol, one cancel-all suffices
+        open_orders = self.client.get_open_orders(symbol)
+        if open_orders is not None and {order['orderId'] for order in open_orders} <= set(order_ids):
+            if self.client.cancel_all_orders(symbol):
+                return len(open_orders)
+        
+        cancelled_orders = 0
+        for i in range(0, len(order_ids), self.CANCEL_BATCH_SIZE):
+            responses = self.client.cancel_orders_batch(symbol, order_ids[i:i + self.CANCEL_BATCH_SIZE])
+            if responses:
+                cancelled_orders += sum(1 for response in responses if 'orderId' in response)
+        
+        return cancelled_orders
+    
     def get_grid_status(self, grid_id):
         """
         Get grid status information
@@ -506,17 +752,14 @@ class GridOrderHandler:
             grid_config = self.active_grids[grid_id]
             
             # Calculate statistics
-            active_buy_orders = sum(1 for level in grid_config['levels'] if level['buy_order_id'])
-            active_sell_orders = sum(1 for level in grid_config['levels'] if level['sell_order_id'])
-            filled_levels = sum(1 for level in grid_config['levels'] if level['filled'])
+            active_buy_orders = int(np.count_nonzero(grid_config['buy_ids']))
+            active_sell_orders = int(np.count_nonzero(grid_config['sell_ids']))
+            filled_levels = int(np.count_nonzero(grid_config['filled']))
             
             # Calculate profit percentage
-            total_investment = grid_config['total_quantity'] * grid_config['lower_price']
+            total_investment = grid_config['_total_investment']
             profit_percentage = (grid_config['total_profit'] / total_investment) * 100 if total_investment > 0 else 0
             
-            # Calculate runtime
-            runtime = datetime.now() - grid_config['start_time']
-            
             status_info = {
                 'grid_id': grid_id,
                 'symbol': grid_config['symbol'],
@@ -532,8 +775,9 @@ class GridOrderHandler:
                 'active_buy_orders': active_buy_orders,
                 'active_sell_orders': active_sell_orders,
                 'filled_levels': filled_levels,
-                'runtime_seconds': runtime.total_seconds(),
-                'start_time': grid_config['start_time']
+                'runtime_seconds': time.monotonic() - grid_config['_start_monotonic'],
+                # Datetime is built only here, for display
+                'start_time': datetime.fromtimestamp(grid_config['start_time_ns'] / 1e9)
             }
             
             return status_info
@@ -577,7 +821,7 @@ class GridOrderHandler:
         """
         try:
             # Get historical data
-            end_time = int(time.time() * 1000)
+            end_time = time.time_ns() // 1_000_000
             start_time = end_time - (lookback_days * 24 * 60 * 60 * 1000)
             
             klines = self.client.get_klines(
@@ -588,20 +832,19 @@ class GridOrderHandler:
                 logger.error(f"No historical data for {symbol}")
                 return {}
             
-            # Extract price data
-            highs = [float(kline[2]) for kline in klines]
-            lows = [float(kline[3]) for kline in klines]
-            closes = [float(kline[4]) for kline in klines]
+            # Extract price data (high, low, close columns) in one conversion
+            prices = np.asarray(klines, dtype=object)[:, 2:5].astype(np.float64)
+            highs, lows, closes = prices[:, 0], prices[:, 1], prices[:, 2]
             
             # Calculate statistics
-            max_price = max(highs)
-            min_price = min(lows)
-            avg_price = sum(closes) / len(closes)
+            max_price = float(highs.max())
+            min_price = float(lows.min())
+            avg_price = float(closes.mean())
             price_range = max_price - min_price
             
             # Calculate volatility
-            returns = [(closes[i] - closes[i-1]) / closes[i-1] for i in range(1, len(closes))]
-            volatility = (sum(r**2 for r in returns) / len(returns)) ** 0.5
+            returns = np.diff(closes) / closes[:-1]
+            volatility = float(np.sqrt((returns * returns).mean()))
             
             # Suggest grid parameters
             suggested_upper = avg_price + (price_range * 0.3)
@@ -628,31 +871,33 @@ class GridOrderHandler:
             logger.error(f"Error calculating optimal grid parameters: {str(e)}")
             return {}
     
+    def _reap(self, grid_id):
+        """
+        Remove a stopped grid from memory once its retention period ends
+        
+        Args:
+            grid_id (str): Grid identifier
+        """
+        self._unregister_grids([grid_id])
+        logger.info(f"Cleaned up stopped grid: {grid_id}")
+    
+    def close(self):
+        """Cancel every grid watchdog and cleanup timer; open grid orders are left in place"""
+        for monitor in list(self.monitoring_threads.values()):
+            monitor.cancel()
+        for grid_config in self.active_grids.values():
+            reap_timer = grid_config.get('_reap_timer')
+            if reap_timer:
+                reap_timer.cancel()
+    
     def cleanup_stopped_grids(self):
         """
-        Clean up stopped grids from memory
+        Report stopped grids still awaiting cleanup
+        
+        Stopped grids are removed by a timer scheduled in stop_grid, so there is
+        nothing left to scan for here.
         
         Returns:
-            int: Number of grids cleaned up
+            int: Number of stopped grids with a pending cleanup timer
         """
-        try:
-            stopped_grids = []
-            
-            for grid_id, config in self.active_grids.items():
-                if config['status'] == 'STOPPED':
-                    # Keep stopped grids for a while before cleanup
-                    if 'stop_time' in config:
-                        time_diff = datetime.now() - config['stop_time']
-                        if time_diff.total_seconds() > 3600:  # Clean up after 1 hour
-                            stopped_grids.append(grid_id)
-            
-            # Remove stopped grids
-            for grid_id in stopped_grids:
-                del self.active_grids[grid_id]
-                logger.info(f"Cleaned up stopped grid: {grid_id}")
-            
-            return len(stopped_grids)
-            
-        except Exception as e:
-            logger.error(f"Error cleaning up grids: {str(e)}")
-            return 0
+        return sum(1 for config in self.active_grids.values() if config.get('_reap_timer'))
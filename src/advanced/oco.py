@@ -3,11 +3,102 @@ OCO (One-Cancels-Other) order handler
 Allows placing two orders simultaneously where execution of one cancels the other
 """
 
+import asyncio
+import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import ROUND_DOWN
+import numpy as np
+from ._precision import quantize
 from ..logger import setup_logger, log_trade, log_error
 
+# numba is optional; large backtest sweeps use the compiled risk-reward kernel
+try:
+    import numba
+except ImportError:
+    numba = None
+
 logger = setup_logger()
 
+_TERMINAL_STATUSES = frozenset({'FILLED', 'CANCELED', 'EXPIRED', 'REJECTED'})
+
+# Futures has no order lists; simulated OCO ids carry this prefix
+_SIM_PREFIX = 'OCO_SIM_'
+
+# Fixed fields of the two OCO legs
+_BASE_LIMIT = {'type': 'LIMIT', 'timeInForce': 'GTC'}
+_BASE_STOP = {'type': 'STOP_MARKET', 'timeInForce': 'GTC'}
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _rr_kernel(entry, tp, sl, out_risk, out_reward, out_rr, out_rpct, out_rwpct, out_fav):
+        for i in numba.prange(entry.shape[0]):
+            e = entry[i]
+            t = tp[i]
+            s = sl[i]
+            if t > e:
+                r = t - e
+                k = e - s
+            else:
+                r = e - t
+                k = s - e
+            rr = r / k if k > 0 else 0.0
+            out_risk[i] = k
+            out_reward[i] = r
+            out_rr[i] = rr
+            out_rpct[i] = k / e * 100
+            out_rwpct[i] = r / e * 100
+            out_fav[i] = rr >= 2.0
+else:
+    _rr_kernel = None
+
+# Below this size the vectorized NumPy path is as fast as the kernel
+_RR_KERNEL_MIN_SIZE = 10_000
+
+@dataclass(slots=True, frozen=True)
+class OCOParams:
+    """Parameters of one OCO order"""
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+    stop_price: float
+    stop_limit_price: float
+    time_in_force: str = 'GTC'
+    stop_limit_time_in_force: str = 'GTC'
+
+def _tp_sl_orders(symbols, quantities, current_prices, take_profit_percentage, stop_loss_percentage):
+    """
+    Compute TP/SL OCO arguments for several positions in one vectorized pass
+    
+    Args:
+        symbols (list): Trading symbols, one per position
+        quantities (array-like): Position quantities (positive for long, negative for short)
+        current_prices (array-like): Current market prices
+        take_profit_percentage (float): Take profit percentage
+        stop_loss_percentage (float): Stop loss percentage
+    
+    Returns:
+        list: (symbol, side, quantity, price, stop_price, stop_limit_price) tuples
+    """
+    quantities = np.asarray(quantities, dtype=np.float64)
+    current_prices = np.asarray(current_prices, dtype=np.float64)
+    is_long = quantities > 0
+    
+    # Long positions sell above/stop below; shorts mirror it
+    tp_offset = take_profit_percentage / 100
+    sl_offset = stop_loss_percentage / 100
+    take_profit_prices = current_prices * np.where(is_long, 1 + tp_offset, 1 - tp_offset)
+    stop_prices = current_prices * np.where(is_long, 1 - sl_offset, 1 + sl_offset)
+    stop_limit_prices = stop_prices * np.where(is_long, 0.995, 1.005)
+    
+    return list(zip(
+        symbols, np.where(is_long, 'SELL', 'BUY').tolist(), np.abs(quantities).tolist(),
+        take_profit_prices.tolist(), stop_prices.tolist(), stop_limit_prices.tolist()
+    ))
+
 class OCOOrderHandler:
     def __init__(self, binance_client):
         """
@@ -17,6 +108,22 @@ class OCOOrderHandler:
             binance_client: Binance API client instance
         """
         self.client = binance_client
+        
+        # Legs go over the WebSocket API when it is reachable, REST otherwise
+        self.use_ws_trade_api = True
+        self.ws_trade_timeout_secs = 2.0
+        
+        # Short-lived cache for polled list/status lookups
+        self.cache_ttl = 0.25
+        self.cache_maxsize = 256
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        
+        # Leg updates pushed over the user data stream; clientOrderId -> (orderListId, leg).
+        # _oco_lock orders stream updates against the placing thread's bookkeeping
+        self._oco_legs = {}
+        self._oco_status_cache = {}
+        self._oco_lock = threading.Lock()
         logger.info("OCO order handler initialized")
     
     def place_order(self, symbol, side, quantity, price, stop_price, stop_limit_price, 
@@ -37,30 +144,42 @@ class OCOOrderHandler:
         Returns:
             dict: OCO order response or None if failed
         """
+        return self.place_order_obj(OCOParams(
+            symbol, side, quantity, price, stop_price, stop_limit_price,
+            time_in_force, stop_limit_time_in_force
+        ))
+    
+    def place_order_obj(self, p):
+        """
+        Place OCO order from a prepared parameter object
+        
+        Args:
+            p (OCOParams): OCO order parameters
+        
+        Returns:
+            dict: OCO order response or None if failed
+        """
+        symbol, side, quantity, price = p.symbol, p.side, p.quantity, p.price
+        
         try:
-            # Prepare OCO order parameters
-            order_params = {
-                'quantity': quantity,
-                'price': price,
-                'stopPrice': stop_price,
-                'stopLimitPrice': stop_limit_price,
-                'timeInForce': time_in_force,
-                'stopLimitTimeInForce': stop_limit_time_in_force
-            }
+            # Stringify once on the symbol's tick/step grid; str(float) can give
+            # scientific notation or off-grid values that the exchange rejects
+            filters = self.client.get_symbol_filters(symbol) or {}
+            tick_size = filters.get('tick_size')
             
-            # Log the order attempt
-            log_trade(
-                logger,
-                'OCO',
-                symbol,
-                side,
-                quantity,
-                price=price,
-                status='ATTEMPTING'
-            )
+            # NEW below carries the same details; the attempt is only worth a debug line
+            logger.debug("TRADE: OCO %s %s %s @ %s - ATTEMPTING", side, quantity, symbol, price)
             
             # Place OCO order using direct API call
-            response = self._place_oco_order(symbol, side, **order_params)
+            response = self._place_oco_order(
+                symbol, side,
+                quantize(quantity, filters.get('step_size'), ROUND_DOWN),
+                quantize(price, tick_size),
+                quantize(p.stop_price, tick_size),
+                quantize(p.stop_limit_price, tick_size),
+                p.time_in_force,
+                p.stop_limit_time_in_force
+            )
             
             if response:
                 # Log successful order
@@ -99,13 +218,14 @@ class OCOOrderHandler:
                     'side': side,
                     'quantity': quantity,
                     'price': price,
-                    'stop_price': stop_price,
-                    'stop_limit_price': stop_limit_price
+                    'stop_price': p.stop_price,
+                    'stop_limit_price': p.stop_limit_price
                 }
             )
             return None
     
-    def _place_oco_order(self, symbol, side, **kwargs):
+    def _place_oco_order(self, symbol, side, quantity, price, stop_price, stop_limit_price,
+                         time_in_force, stop_limit_time_in_force):
         """
         Internal method to simulate OCO order using separate orders
         Note: Binance Futures API doesn't support native OCO, so we use limit + stop orders
@@ -113,60 +233,328 @@ class OCOOrderHandler:
         Args:
             symbol (str): Trading symbol
             side (str): Order side
-            **kwargs: Order parameters
+            quantity (str): Formatted order quantity
+            price (str): Formatted limit order price
+            stop_price (str): Formatted stop trigger price
+            stop_limit_price (str): Formatted stop limit price (unused; the stop leg is STOP_MARKET)
+            time_in_force (str): Time in force for limit order
+            stop_limit_time_in_force (str): Time in force for stop leg (unused; STOP_MARKET is GTC)
         
         Returns:
             dict: Simulated OCO response
         """
         try:
-            # Extract parameters
-            quantity = kwargs.get('quantity')
-            price = kwargs.get('price')
-            stop_price = kwargs.get('stopPrice')
-            time_in_force = kwargs.get('timeInForce', 'GTC')
+            # Leg updates (and the cancel-other on fill) need the user data stream
+            stream = self.client.get_user_data_stream()
+            if stream is not None:
+                stream.add_listener(self._on_user_event)
+            else:
+                logger.warning("User data stream unavailable; OCO legs won't cancel each other on fill")
+            
+            next_id = self.client.next_client_order_id
             
-            # Place limit order first (main order)
+            # Limit order (main order)
             limit_params = {
+                **_BASE_LIMIT,
                 'symbol': symbol,
                 'side': side,
-                'type': 'LIMIT',
-                'quantity': str(quantity),
-                'price': str(price),
-                'timeInForce': time_in_force
+                'quantity': quantity,
+                'price': price,
+                'timeInForce': time_in_force,
+                'newClientOrderId': next_id('oco-')
+            }
+            
+            # Protective stop order (opposite direction for protection)
+            stop_params = {
+                **_BASE_STOP,
+                'symbol': symbol,
+                'side': 'SELL' if side == 'BUY' else 'BUY',
+                'quantity': quantity,
+                'stopPrice': stop_price,
+                'newClientOrderId': next_id('oco-')
             }
             
-            limit_response = self.client._make_request('POST', '/fapi/v1/order', limit_params, signed=True)
+            # Register the legs before sending so a fill pushed ahead of the
+            # responses still cancels the other leg
+            order_list_id = f"{_SIM_PREFIX}{limit_params['newClientOrderId']}"
+            self._register_oco(
+                order_list_id, symbol, limit_params['newClientOrderId'], stop_params['newClientOrderId']
+            )
+            
+            session = self.client.get_ws_trade_session() if self.use_ws_trade_api else None
+            if session:
+                # Both legs are in flight on the socket before either response is awaited
+                request_ids = [session.send('order.place', limit_params), session.send('order.place', stop_params)]
+                limit_response, stop_response = (
+                    session.wait(request_id, self.ws_trade_timeout_secs) if request_id else None
+                    for request_id in request_ids
+                )
+            else:
+                # Submit both legs in one signed batch request
+                responses = self.client.place_orders_batch([limit_params, stop_params]) or [{}, {}]
+                limit_response, stop_response = (
+                    response if 'orderId' in response else None for response in responses
+                )
+            
+            # Recover or retry missing legs over REST, both at once
+            limit_future = self.client.io_executor.submit(self.client.recover_order, limit_params) if limit_response is None else None
+            stop_future = self.client.io_executor.submit(self.client.recover_order, stop_params) if stop_response is None else None
+            if limit_future:
+                limit_response = limit_future.result()
+            if stop_future:
+                stop_response = stop_future.result()
+            
+            # Without the stop the pair isn't an OCO; pull the limit leg back
+            if limit_response and not stop_response:
+                self._unregister_oco(order_list_id)
+                logger.error(f"OCO stop leg failed, cancelling limit order: {symbol} {side} {quantity} @ {price}")
+                self.client.cancel_order(symbol, order_id=limit_response['orderId'])
+                return None
             
             if limit_response:
-                logger.info(f"OCO-style limit order placed: {symbol} {side} {quantity} @ {price}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("OCO-style limit order placed: %s %s %s @ %s", symbol, side, quantity, price)
                 
-                # Place protective stop order (opposite direction for protection)
-                stop_side = 'SELL' if side == 'BUY' else 'BUY'
-                stop_params = {
-                    'symbol': symbol,
-                    'side': stop_side,
-                    'type': 'STOP_MARKET',
-                    'quantity': str(quantity),
-                    'stopPrice': str(stop_price),
-                    'timeInForce': 'GTC'
-                }
-                
-                stop_response = self.client._make_request('POST', '/fapi/v1/order', stop_params, signed=True)
+                self._track_oco(order_list_id, limit_response, stop_response)
                 
                 return {
-                    'orderListId': f"OCO_SIM_{int(time.time())}",
+                    'orderListId': order_list_id,
                     'limit_order': limit_response,
                     'stop_order': stop_response,
                     'type': 'OCO_SIMULATION',
                     'status': 'FILLED' if limit_response.get('status') == 'FILLED' else 'NEW'
                 }
             
+            # Don't leave an orphaned stop behind a failed limit leg
+            self._unregister_oco(order_list_id)
+            if stop_response:
+                self.client.cancel_order(symbol, order_id=stop_response['orderId'])
+            
             return None
             
         except Exception as e:
             logger.error(f"Error in OCO simulation: {str(e)}")
             return None
     
+    def _cache_get(self, key):
+        """
+        Get a cached response if it has not expired
+        
+        Args:
+            key (tuple): Cache key
+        
+        Returns:
+            Cached response or None
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            return None
+    
+    def _cache_put(self, key, value):
+        """
+        Cache a response for cache_ttl seconds
+        
+        Args:
+            key (tuple): Cache key
+            value: Response to cache
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(self._cache) >= self.cache_maxsize:
+                self._cache = {k: entry for k, entry in self._cache.items() if entry[0] > now}
+                if len(self._cache) >= self.cache_maxsize:
+                    self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = (now + self.cache_ttl, value)
+    
+    def _cache_invalidate(self, symbol, order_list_id):
+        """
+        Drop cached entries that a state change on an order list makes stale
+        
+        Args:
+            symbol (str): Trading symbol
+            order_list_id (int): OCO order list ID
+        """
+        with self._cache_lock:
+            for key in (('status', symbol, order_list_id), ('list', symbol), ('list', None)):
+                self._cache.pop(key, None)
+    
+    def _register_oco(self, order_list_id, symbol, limit_client_id, stop_client_id):
+        """
+        Start tracking a simulated OCO's legs before they are sent
+        
+        Args:
+            order_list_id (str): Simulated order list ID
+            symbol (str): Trading symbol
+            limit_client_id (str): Limit leg clientOrderId
+            stop_client_id (str): Stop leg clientOrderId
+        """
+        with self._oco_lock:
+            self._oco_status_cache[order_list_id] = {
+                'orderListId': order_list_id,
+                'symbol': symbol,
+                'listOrderStatus': 'EXECUTING',
+                'cancel_requested': False,
+                'orders': {
+                    leg: {'orderId': None, 'clientOrderId': client_id, 'status': 'NEW'}
+                    for leg, client_id in (('limit', limit_client_id), ('stop', stop_client_id))
+                }
+            }
+            self._oco_legs[limit_client_id] = (order_list_id, 'limit')
+            self._oco_legs[stop_client_id] = (order_list_id, 'stop')
+    
+    def _unregister_oco(self, order_list_id):
+        """
+        Stop tracking a simulated OCO that failed to place
+        
+        Args:
+            order_list_id (str): Simulated order list ID
+        """
+        with self._oco_lock:
+            record = self._oco_status_cache.pop(order_list_id, None)
+            if record is not None:
+                for o in record['orders'].values():
+                    self._oco_legs.pop(o['clientOrderId'], None)
+    
+    def _track_oco(self, order_list_id, limit_response, stop_response):
+        """
+        Fill in a registered OCO's leg responses
+        
+        A status already pushed over the user data stream wins over the
+        response's, and a leg that came back FILLED cancels the other.
+        
+        Args:
+            order_list_id (str): Simulated order list ID
+            limit_response (dict): Limit leg order response
+            stop_response (dict): Stop leg order response
+        """
+        with self._oco_lock:
+            record = self._oco_status_cache.get(order_list_id)
+            if record is None:
+                return
+            
+            for leg, response in (('limit', limit_response), ('stop', stop_response)):
+                o = record['orders'][leg]
+                o['orderId'] = response['orderId']
+                if o['status'] not in _TERMINAL_STATUSES:
+                    o['status'] = response.get('status', 'NEW')
+            
+            self._settle_oco(record)
+    
+    def _settle_oco(self, record):
+        """
+        Cancel the other leg once one leg has filled; call with _oco_lock held
+        
+        Args:
+            record (dict): Simulated OCO status record
+        """
+        orders = record['orders']
+        for leg, other_leg in (('limit', 'stop'), ('stop', 'limit')):
+            other = orders[other_leg]
+            if (orders[leg]['status'] == 'FILLED' and other['status'] not in _TERMINAL_STATUSES
+                    and not record['cancel_requested']):
+                # Off the caller's thread; cancel is a REST round-trip. The clientOrderId
+                # is known even before the leg's response has arrived
+                record['cancel_requested'] = True
+                self.client.io_executor.submit(self._cancel_other_leg, record, other['clientOrderId'])
+                logger.info(f"OCO {record['orderListId']}: {leg} leg filled, cancelling the other leg")
+        
+        # Settled records are dropped; monitor_oco_order reports unknown simulated ids as done
+        if all(o['status'] in _TERMINAL_STATUSES for o in orders.values()):
+            record['listOrderStatus'] = 'ALL_DONE'
+            self._oco_status_cache.pop(record['orderListId'], None)
+            for o in orders.values():
+                self._oco_legs.pop(o['clientOrderId'], None)
+    
+    def _cancel_other_leg(self, record, client_order_id):
+        """
+        Cancel the unfilled leg of a simulated OCO
+        
+        On failure the record is left uncancelled, so the next update for
+        the OCO tries again.
+        
+        Args:
+            record (dict): Simulated OCO status record
+            client_order_id (str): clientOrderId of the leg to cancel
+        """
+        try:
+            response = self.client.cancel_order(record['symbol'], orig_client_order_id=client_order_id)
+        except Exception as e:
+            logger.error(f"Error cancelling OCO leg {client_order_id}: {str(e)}")
+            response = None
+        
+        if not response:
+            with self._oco_lock:
+                record['cancel_requested'] = False
+            log_error(
+                logger,
+                'OCO_LEG_CANCEL_ERROR',
+                f"Failed to cancel the other leg of OCO {record['orderListId']}",
+                {'symbol': record['symbol'], 'client_order_id': client_order_id}
+            )
+    
+    def _cancel_simulated_oco(self, symbol, order_list_id):
+        """
+        Cancel both legs of a simulated OCO by clientOrderId
+        
+        Args:
+            symbol (str): Trading symbol
+            order_list_id (str): Simulated order list ID
+        
+        Returns:
+            dict: Cancel response or None if failed
+        """
+        with self._oco_lock:
+            record = self._oco_status_cache.get(order_list_id)
+            if record is None:
+                logger.error(f"Unknown or already settled OCO order: {order_list_id}")
+                return None
+            record['cancel_requested'] = True
+            open_legs = [
+                o['clientOrderId'] for o in record['orders'].values() if o['status'] not in _TERMINAL_STATUSES
+            ]
+        
+        futures = [
+            self.client.io_executor.submit(self.client.cancel_order, symbol, orig_client_order_id=client_id)
+            for client_id in open_legs
+        ]
+        responses = [future.result() for future in futures]
+        
+        if not all(responses):
+            # Keep tracking so a fill on a surviving leg still cancels the other
+            with self._oco_lock:
+                record['cancel_requested'] = False
+            return None
+        
+        self._unregister_oco(order_list_id)
+        return {'orderListId': order_list_id, 'listOrderStatus': 'ALL_DONE', 'orders': responses}
+    
+    def _on_user_event(self, event):
+        """
+        Update simulated OCO status from order updates and cancel the other leg on fill
+        
+        Args:
+            event (dict): User data stream event
+        """
+        try:
+            if event.get('e') != 'ORDER_TRADE_UPDATE':
+                return
+            
+            order = event['o']
+            with self._oco_lock:
+                entry = self._oco_legs.get(order.get('c'))
+                if entry is None:
+                    return
+                
+                order_list_id, leg = entry
+                record = self._oco_status_cache[order_list_id]
+                record['orders'][leg]['status'] = order['X']
+                self._settle_oco(record)
+                    
+        except Exception as e:
+            logger.error(f"Error handling OCO order update: {str(e)}")
+    
     def place_sell_oco(self, symbol, quantity, limit_price, stop_price, stop_limit_price):
         """
         Place sell OCO order (take profit + stop loss)
@@ -205,7 +593,7 @@ class OCOOrderHandler:
     
     def cancel_oco_order(self, symbol, order_list_id):
         """
-        Cancel OCO order
+        Cancel OCO order and drop its cached status
         
         Args:
             symbol (str): Trading symbol
@@ -215,16 +603,15 @@ class OCOOrderHandler:
             dict: Cancel response or None if failed
         """
         try:
-            params = {
-                'symbol': symbol,
-                'orderListId': order_list_id,
-                'timestamp': int(time.time() * 1000)
-            }
-            params['signature'] = self.client._generate_signature(params)
-            
-            response = self.client._make_request('DELETE', '/fapi/v1/orderList', params, signed=True)
+            if str(order_list_id).startswith(_SIM_PREFIX):
+                response = self._cancel_simulated_oco(symbol, order_list_id)
+            else:
+                response = self.client._sign_and_send(
+                    'DELETE', '/fapi/v1/orderList', [('symbol', symbol), ('orderListId', order_list_id)]
+                )
             
             if response:
+                self._cache_invalidate(symbol, order_list_id)
                 logger.info(f"OCO order cancelled successfully: {order_list_id}")
                 log_trade(
                     logger,
@@ -253,27 +640,31 @@ class OCOOrderHandler:
             )
             return None
     
-    def get_oco_orders(self, symbol=None):
+    def get_oco_orders(self, symbol=None, force_refresh=False):
         """
         Get OCO orders
         
         Args:
             symbol (str, optional): Trading symbol
+            force_refresh (bool): Bypass the short-lived response cache
         
         Returns:
             list: List of OCO orders
         """
         try:
-            params = {'timestamp': int(time.time() * 1000)}
-            if symbol:
-                params['symbol'] = symbol
-            
-            params['signature'] = self.client._generate_signature(params)
+            cache_key = ('list', symbol)
+            if not force_refresh:
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return cached
             
-            response = self.client._make_request('GET', '/fapi/v1/allOrderList', params, signed=True)
+            parts = [('symbol', symbol)] if symbol else []
+            response = self.client._sign_and_send('GET', '/fapi/v1/allOrderList', parts)
             
             if response is not None:
-                logger.info(f"Retrieved {len(response) if response else 0} OCO orders")
+                self._cache_put(cache_key, response)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Retrieved %d OCO orders", len(response))
                 return response
             else:
                 logger.error("Failed to retrieve OCO orders")
@@ -338,28 +729,81 @@ class OCOOrderHandler:
             )
             return None
     
-    def monitor_oco_order(self, symbol, order_list_id):
+    def create_take_profit_stop_loss_batch(self, symbols, quantities, current_prices,
+                                           take_profit_percentage=2.0, stop_loss_percentage=1.0):
+        """
+        Create TP/SL OCO orders for several positions at once
+        
+        Prices for all positions are computed in one vectorized pass and the
+        orders are then submitted in parallel.
+        
+        Args:
+            symbols (list): Trading symbols, one per position
+            quantities (array-like): Position quantities (positive for long, negative for short)
+            current_prices (array-like): Current market prices
+            take_profit_percentage (float): Take profit percentage
+            stop_loss_percentage (float): Stop loss percentage
+        
+        Returns:
+            list: OCO order responses (None for failed positions), in input order
+        """
+        try:
+            orders = _tp_sl_orders(symbols, quantities, current_prices,
+                                   take_profit_percentage, stop_loss_percentage)
+            
+            # A dedicated pool: place_order itself waits on the client's I/O executor
+            with ThreadPoolExecutor(max_workers=min(8, max(1, len(orders)))) as pool:
+                futures = [pool.submit(self.place_order, *order) for order in orders]
+                return [future.result() for future in futures]
+            
+        except Exception as e:
+            error_msg = f"Error creating batch TP/SL OCO orders: {str(e)}"
+            log_error(
+                logger,
+                'TP_SL_OCO_BATCH_ERROR',
+                error_msg,
+                {
+                    'symbols': list(symbols),
+                    'take_profit_percentage': take_profit_percentage,
+                    'stop_loss_percentage': stop_loss_percentage
+                }
+            )
+            return []
+    
+    def monitor_oco_order(self, symbol, order_list_id, force_refresh=False):
         """
         Monitor OCO order status
         
         Args:
             symbol (str): Trading symbol
             order_list_id (int): OCO order list ID
+            force_refresh (bool): Bypass the short-lived response cache
         
         Returns:
             dict: Order status information
         """
         try:
-            params = {
-                'symbol': symbol,
-                'orderListId': order_list_id,
-                'timestamp': int(time.time() * 1000)
-            }
-            params['signature'] = self.client._generate_signature(params)
+            # Simulated OCOs are kept current by the user data stream; settled ones
+            # are no longer tracked. Copied so the caller never sees a half-applied update
+            if str(order_list_id).startswith(_SIM_PREFIX):
+                with self._oco_lock:
+                    record = self._oco_status_cache.get(order_list_id)
+                    if record is None:
+                        return {'orderListId': order_list_id, 'symbol': symbol, 'listOrderStatus': 'ALL_DONE'}
+                    return {**record, 'orders': {leg: dict(o) for leg, o in record['orders'].items()}}
             
-            response = self.client._make_request('GET', '/fapi/v1/orderList', params, signed=True)
+            cache_key = ('status', symbol, order_list_id)
+            if not force_refresh:
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return cached
+            
+            response = self.client._sign_and_send(
+                'GET', '/fapi/v1/orderList', [('symbol', symbol), ('orderListId', order_list_id)]
+            )
             
             if response:
+                self._cache_put(cache_key, response)
                 status = response.get('listOrderStatus', 'UNKNOWN')
                 logger.info(f"OCO order {order_list_id} status: {status}")
                 return response
@@ -384,22 +828,69 @@ class OCOOrderHandler:
             dict: Risk-reward analysis
         """
         try:
+            batch = self.calculate_risk_reward_ratio_batch(
+                [entry_price], [take_profit_price], [stop_loss_price]
+            )
+            if not batch:
+                return {}
+            
+            analysis = {key: values[0].item() for key, values in batch.items()}
+            
+            logger.info(f"Risk-reward ratio: 1:{analysis['risk_reward_ratio']:.2f}")
+            return analysis
+            
+        except Exception as e:
+            logger.error(f"Error calculating risk-reward ratio: {str(e)}")
+            return {}
+    
+    def calculate_risk_reward_ratio_batch(self, entry_prices, take_profit_prices, stop_loss_prices):
+        """
+        Calculate risk-reward ratios for many candidate trades at once
+        
+        Args:
+            entry_prices (array-like): Entry prices
+            take_profit_prices (array-like): Take profit prices
+            stop_loss_prices (array-like): Stop loss prices
+        
+        Returns:
+            dict: Risk-reward analysis with one array per field
+        """
+        try:
+            entry = np.asarray(entry_prices, dtype=np.float64)
+            take_profit = np.asarray(take_profit_prices, dtype=np.float64)
+            stop_loss = np.asarray(stop_loss_prices, dtype=np.float64)
+            
+            if _rr_kernel is not None and entry.ndim == 1 and entry.size >= _RR_KERNEL_MIN_SIZE:
+                entry, take_profit, stop_loss = np.broadcast_arrays(entry, take_profit, stop_loss)
+                n = entry.shape[0]
+                risk, reward, risk_reward_ratio, risk_percentage, reward_percentage = (
+                    np.empty(n) for _ in range(5)
+                )
+                is_favorable = np.empty(n, dtype=np.bool_)
+                _rr_kernel(np.ascontiguousarray(entry), np.ascontiguousarray(take_profit),
+                           np.ascontiguousarray(stop_loss), risk, reward, risk_reward_ratio,
+                           risk_percentage, reward_percentage, is_favorable)
+                return {
+                    'risk_amount': risk,
+                    'reward_amount': reward,
+                    'risk_reward_ratio': risk_reward_ratio,
+                    'risk_percentage': risk_percentage,
+                    'reward_percentage': reward_percentage,
+                    'is_favorable': is_favorable
+                }
+            
             # Determine trade direction
-            if take_profit_price > entry_price:
-                # Long trade
-                reward = take_profit_price - entry_price
-                risk = entry_price - stop_loss_price
-            else:
-                # Short trade
-                reward = entry_price - take_profit_price
-                risk = stop_loss_price - entry_price
+            is_long = take_profit > entry
+            reward = np.where(is_long, take_profit - entry, entry - take_profit)
+            risk = np.where(is_long, entry - stop_loss, stop_loss - entry)
             
             # Calculate ratios
-            risk_reward_ratio = reward / risk if risk > 0 else 0
-            risk_percentage = (risk / entry_price) * 100
-            reward_percentage = (reward / entry_price) * 100
+            risk_reward_ratio = np.divide(reward, risk, out=np.zeros_like(reward), where=risk > 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                risk_percentage = risk / entry * 100
+                reward_percentage = reward / entry * 100
             
-            analysis = {
+            return {
                 'risk_amount': risk,
                 'reward_amount': reward,
                 'risk_reward_ratio': risk_reward_ratio,
@@ -408,9 +899,69 @@ class OCOOrderHandler:
                 'is_favorable': risk_reward_ratio >= 2.0  # 1:2 risk-reward minimum
             }
             
-            logger.info(f"Risk-reward ratio: 1:{risk_reward_ratio:.2f}")
-            return analysis
-            
         except Exception as e:
-            logger.error(f"Error calculating risk-reward ratio: {str(e)}")
+            logger.error(f"Error calculating batch risk-reward ratios: {str(e)}")
             return {}
+
+class AsyncOCOOrderHandler:
+    """
+    Coroutine interface to OCOOrderHandler for asyncio-based strategies
+    
+    Each call runs the blocking handler method in the event loop's default
+    executor, so awaiting an OCO never stalls the loop and concurrent OCOs
+    share the client's pooled keep-alive connections.
+    """
+    
+    def __init__(self, binance_client, handler=None):
+        """
+        Initialize async OCO order handler
+        
+        Args:
+            binance_client: Binance API client instance
+            handler (OCOOrderHandler, optional): Existing handler to share state with
+        """
+        self.handler = handler or OCOOrderHandler(binance_client)
+    
+    async def place_order(self, symbol, side, quantity, price, stop_price, stop_limit_price,
+                          time_in_force='GTC', stop_limit_time_in_force='GTC'):
+        """Place OCO order; see OCOOrderHandler.place_order"""
+        return await asyncio.to_thread(
+            self.handler.place_order, symbol, side, quantity, price, stop_price,
+            stop_limit_price, time_in_force, stop_limit_time_in_force
+        )
+    
+    async def cancel_oco_order(self, symbol, order_list_id):
+        """Cancel OCO order; see OCOOrderHandler.cancel_oco_order"""
+        return await asyncio.to_thread(self.handler.cancel_oco_order, symbol, order_list_id)
+    
+    async def get_oco_orders(self, symbol=None, force_refresh=False):
+        """Get OCO orders; see OCOOrderHandler.get_oco_orders"""
+        return await asyncio.to_thread(self.handler.get_oco_orders, symbol, force_refresh)
+    
+    async def monitor_oco_order(self, symbol, order_list_id, force_refresh=False):
+        """Get OCO order status; see OCOOrderHandler.monitor_oco_order"""
+        return await asyncio.to_thread(self.handler.monitor_oco_order, symbol, order_list_id, force_refresh)
+    
+    async def create_take_profit_stop_loss_batch(self, symbols, quantities, current_prices,
+                                                 take_profit_percentage=2.0, stop_loss_percentage=1.0):
+        """
+        Create TP/SL OCO orders for several positions concurrently
+        
+        Args:
+            symbols (list): Trading symbols, one per position
+            quantities (array-like): Position quantities (positive for long, negative for short)
+            current_prices (array-like): Current market prices
+            take_profit_percentage (float): Take profit percentage
+            stop_loss_percentage (float): Stop loss percentage
+        
+        Returns:
+            list: OCO order responses (None for failed positions), in input order
+        """
+        try:
+            orders = _tp_sl_orders(symbols, quantities, current_prices,
+                                   take_profit_percentage, stop_loss_percentage)
+            return await asyncio.gather(*(self.place_order(*order) for order in orders))
+            
+        except Exception as e:
+            logger.error(f"Error creating async batch TP/SL OCO orders: {str(e)}")
+            return [None] * len(symbols)
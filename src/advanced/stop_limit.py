@@ -3,13 +3,81 @@ Stop-Limit order handler
 Triggers a limit order when a stop price is reached
 """
 
+import asyncio
+import bisect
+import heapq
+import itertools
 import time
 import threading
+from array import array
+from dataclasses import dataclass
+from decimal import ROUND_DOWN
+import numpy as np
+from ._precision import quantize
 from ..logger import setup_logger, log_trade, log_error
+from ..market_orders import MarketOrderHandler
+from ..websocket_client import WebSocketClient
 
 logger = setup_logger()
 
+# Keyed by "position is long": closing side and default limit-price multiplier
+_SL_TABLE = {True: ('SELL', 0.99), False: ('BUY', 1.01)}
+_TP_TABLE = {True: ('SELL', 1.01), False: ('BUY', 0.99)}
+
+# Order types reported by get_stop_orders
+_STOP_TYPES = frozenset({
+    'STOP', 'STOP_MARKET', 'TAKE_PROFIT', 'TAKE_PROFIT_MARKET', 'TRAILING_STOP_MARKET'
+})
+
+@dataclass(slots=True)
+class StopCondition:
+    """A manual stop: order to send once price crosses trigger_price"""
+    symbol: str
+    side: str
+    quantity: float
+    trigger_price: float
+    trigger_type: str  # 'above' or 'below'
+    order_type: str = 'MARKET'
+    limit_price: float = None
+
+@dataclass(slots=True)
+class _Monitor:
+    """Conditions registered by one monitor_price_for_manual_stops call"""
+    symbol: str
+    conditions: list
+    active: bool = True
+
+def _stop_level_arrays(entry_prices, signs, risk_percentage, reward_ratio):
+    """
+    Vectorized stop loss / take profit levels
+    
+    Args:
+        entry_prices (np.ndarray): Entry prices
+        signs (np.ndarray): 1.0 for long positions, -1.0 for short
+        risk_percentage (float): Risk percentage
+        reward_ratio (float): Risk-reward ratio
+    
+    Returns:
+        dict: Levels as arrays, plus the scalar inputs
+    """
+    risk_amount = entry_prices * (risk_percentage * 0.01)
+    reward_amount = risk_amount * reward_ratio
+    
+    return {
+        'entry_price': entry_prices,
+        'stop_loss': entry_prices - signs * risk_amount,
+        'take_profit': entry_prices + signs * reward_amount,
+        'risk_amount': risk_amount,
+        'reward_amount': reward_amount,
+        'risk_percentage': risk_percentage,
+        'reward_percentage': risk_percentage * reward_ratio,
+        'risk_reward_ratio': reward_ratio
+    }
+
 class StopLimitOrderHandler:
+    # Direction of a position's profit, by position side
+    _SIDE_SIGN = {'LONG': 1.0, 'SHORT': -1.0}
+    
     def __init__(self, binance_client):
         """
         Initialize Stop-Limit order handler
@@ -18,9 +86,43 @@ class StopLimitOrderHandler:
             binance_client: Binance API client instance
         """
         self.client = binance_client
+        self.market_handler = MarketOrderHandler(binance_client)
         self.monitoring_orders = {}
-        self.monitor_thread = None
+        self._monitor_seq = itertools.count(1)
         self.is_monitoring = False
+        
+        # The price watchdog runs on the client's shared event loop
+        self.monitor_task = None
+        
+        # Manual stops are evaluated on bookTicker pushes. Per symbol and trigger
+        # type, trigger keys are kept sorted in a double array next to their
+        # (monitor_id, condition) entries so every condition a price has crossed is one prefix slice;
+        # 'below' keys are negated so both directions fire on the same prefix
+        self.price_stream = None
+        self.stream_check_interval = 5
+        self._triggers_by_symbol = {}
+        self._monitor_lock = threading.Lock()
+        
+        # REST fallback schedule: (deadline, symbol) min-heap; symbols far from
+        # their nearest trigger are polled less often
+        self.poll_secs_per_pct = 5.0
+        self.min_poll_interval = 0.2
+        self.max_poll_interval = 60.0
+        self._poll_schedule = []
+        
+        # Orders are held back while the API is slower than this
+        self.max_rtt_ms = 1000
+        self.latency_backoff_secs = 0.5
+        
+        # Last known state of orders this handler placed or looked up;
+        # orderId -> (monotonic time, order)
+        self.order_cache_ttl = 2.0
+        self.order_cache_maxsize = 1024
+        self._order_cache = {}
+        
+        # Short-lived cache of filtered open stop orders; symbol -> (monotonic time, orders)
+        self.cache_ttl = 0.5
+        self._open_orders_cache = {}
         logger.info("Stop-Limit order handler initialized")
     
     def place_order(self, symbol, side, quantity, stop_price, limit_price, 
@@ -42,6 +144,14 @@ class StopLimitOrderHandler:
             dict: Order response or None if failed
         """
         try:
+            if not self._latency_ok():
+                log_error(
+                    logger,
+                    'HIGH_LATENCY',
+                    f"API round-trip above {self.max_rtt_ms}ms, not placing stop-limit order: {symbol} {side} {quantity}"
+                )
+                return None
+            
             # Prepare order parameters
             order_params = {
                 'quantity': quantity,
@@ -52,17 +162,6 @@ class StopLimitOrderHandler:
                 'workingType': working_type
             }
             
-            # Log the order attempt
-            log_trade(
-                logger,
-                'STOP_LIMIT',
-                symbol,
-                side,
-                quantity,
-                price=limit_price,
-                status='ATTEMPTING'
-            )
-            
             # Place the order
             response = self.client.place_order(
                 symbol=symbol,
@@ -72,9 +171,12 @@ class StopLimitOrderHandler:
             )
             
             if response:
+                self._invalidate_stop_orders(symbol)
+                self._cache_order(response)
+                
                 # Log successful order
                 order_id = response.get('orderId', 'Unknown')
-                status = response.get('status', 'Unknown')
+                status = response.get('status', 'NEW')
                 
                 log_trade(
                     logger,
@@ -87,7 +189,7 @@ class StopLimitOrderHandler:
                     status=status
                 )
                 
-                logger.info(f"Stop-limit order placed successfully: {order_id}")
+                logger.info("Stop-limit order placed successfully: %s", order_id)
                 return response
             else:
                 # Log failed order
@@ -114,6 +216,25 @@ class StopLimitOrderHandler:
             )
             return None
     
+    def _latency_ok(self):
+        """
+        Check that the API round-trip time is within max_rtt_ms
+        
+        When the moving average is over the limit, waits once and re-measures
+        with a ping so a single slow response doesn't block orders for long.
+        
+        Returns:
+            bool: True if orders should be sent
+        """
+        rtt_ms = self.client.rtt_ms()
+        if rtt_ms is None or rtt_ms <= self.max_rtt_ms:
+            return True
+        
+        time.sleep(self.latency_backoff_secs)
+        start = time.perf_counter()
+        self.client.ping()
+        return (time.perf_counter() - start) * 1000 <= self.max_rtt_ms
+    
     def place_stop_loss(self, symbol, quantity, stop_price, limit_price=None):
         """
         Place stop-loss order
@@ -128,26 +249,10 @@ class StopLimitOrderHandler:
             dict: Order response
         """
         try:
-            # Determine order side based on quantity
-            if quantity > 0:
-                side = 'SELL'  # Close long position
-            else:
-                side = 'BUY'   # Close short position
-                quantity = abs(quantity)
-            
-            # Set default limit price if not provided
-            if limit_price is None:
-                if side == 'SELL':
-                    limit_price = stop_price * 0.99  # Slightly below stop for sells
-                else:
-                    limit_price = stop_price * 1.01  # Slightly above stop for buys
-            
-            return self.place_order(
-                symbol, side, quantity, stop_price, limit_price, reduce_only=True
-            )
+            return self._place_protective(symbol, quantity, stop_price, limit_price, _SL_TABLE)
             
         except Exception as e:
-            logger.error(f"Error placing stop-loss order: {str(e)}")
+            logger.error("Error placing stop-loss order: %s", e)
             return None
     
     def place_take_profit(self, symbol, quantity, stop_price, limit_price=None):
@@ -164,28 +269,35 @@ class StopLimitOrderHandler:
             dict: Order response
         """
         try:
-            # Determine order side based on quantity
-            if quantity > 0:
-                side = 'SELL'  # Take profit on long position
-            else:
-                side = 'BUY'   # Take profit on short position
-                quantity = abs(quantity)
-            
-            # Set default limit price if not provided
-            if limit_price is None:
-                if side == 'SELL':
-                    limit_price = stop_price * 1.01  # Slightly above trigger for sells
-                else:
-                    limit_price = stop_price * 0.99  # Slightly below trigger for buys
-            
-            return self.place_order(
-                symbol, side, quantity, stop_price, limit_price, reduce_only=True
-            )
+            return self._place_protective(symbol, quantity, stop_price, limit_price, _TP_TABLE)
             
         except Exception as e:
-            logger.error(f"Error placing take-profit order: {str(e)}")
+            logger.error("Error placing take-profit order: %s", e)
             return None
     
+    def _place_protective(self, symbol, quantity, stop_price, limit_price, table):
+        """
+        Place a reduce-only order closing a position
+        
+        Args:
+            symbol (str): Trading symbol
+            quantity (float): Position quantity (positive for long, negative for short)
+            stop_price (float): Trigger price
+            limit_price (float, optional): Limit price; derived from stop_price if None
+            table (dict): _SL_TABLE or _TP_TABLE
+        
+        Returns:
+            dict: Order response
+        """
+        # Closing side and default limit offset depend only on the position's direction
+        side, multiplier = table[quantity > 0]
+        if limit_price is None:
+            limit_price = stop_price * multiplier
+        
+        return self.place_order(
+            symbol, side, abs(quantity), stop_price, limit_price, reduce_only=True
+        )
+    
     def place_trailing_stop(self, symbol, side, quantity, callback_rate, activation_price=None):
         """
         Place trailing stop order
@@ -210,16 +322,6 @@ class StopLimitOrderHandler:
             if activation_price:
                 order_params['activationPrice'] = activation_price
             
-            # Log the order attempt
-            log_trade(
-                logger,
-                'TRAILING_STOP',
-                symbol,
-                side,
-                quantity,
-                status='ATTEMPTING'
-            )
-            
             response = self.client.place_order(
                 symbol=symbol,
                 side=side,
@@ -228,6 +330,7 @@ class StopLimitOrderHandler:
             )
             
             if response:
+                self._invalidate_stop_orders(symbol)
                 order_id = response.get('orderId', 'Unknown')
                 log_trade(
                     logger,
@@ -238,7 +341,7 @@ class StopLimitOrderHandler:
                     order_id=order_id,
                     status='NEW'
                 )
-                logger.info(f"Trailing stop order placed: {order_id}")
+                logger.info("Trailing stop order placed: %s", order_id)
                 return response
             else:
                 logger.error("Failed to place trailing stop order")
@@ -274,18 +377,34 @@ class StopLimitOrderHandler:
         """
         try:
             # Get current order details
-            current_order = self.client.get_order_status(symbol, order_id=order_id)
+            # Only static fields (side, quantity, prices, type) are needed, so any cached copy will do
+            current_order = self._get_order(symbol, order_id)
             
             if not current_order:
-                logger.error(f"Could not retrieve order {order_id} for modification")
+                logger.error("Could not retrieve order %s for modification", order_id)
                 return None
             
+            # LIMIT orders can be amended in place, so they never leave the book;
+            # the amend endpoint cannot change a stop price
+            if current_order.get('type') == 'LIMIT' and new_limit_price and not new_stop_price:
+                amended = self.client.amend_order(
+                    symbol, current_order['side'], current_order['origQty'], new_limit_price,
+                    order_id=order_id
+                )
+                if amended and 'orderId' in amended:
+                    self._invalidate_stop_orders(symbol)
+                    self._cache_order(amended)
+                    logger.info("Order amended in place: %s @ %s", order_id, new_limit_price)
+                    return amended
+                logger.warning("Amend failed for order %s, falling back to cancel/replace", order_id)
+            
             # Cancel existing order
             cancel_response = self.client.cancel_order(symbol, order_id=order_id)
             
             if not cancel_response:
-                logger.error(f"Failed to cancel order {order_id} for modification")
+                logger.error("Failed to cancel order %s for modification", order_id)
                 return None
+            self._order_cache.pop(order_id, None)
             
             # Prepare new order parameters
             quantity = float(current_order['origQty'])
@@ -294,13 +413,16 @@ class StopLimitOrderHandler:
             limit_price = new_limit_price if new_limit_price else float(current_order['price'])
             
             # Place new order with modified parameters
-            new_order = self.place_order(symbol, side, quantity, stop_price, limit_price)
+            new_order = self.place_order(
+                symbol, side, quantity, stop_price, limit_price,
+                reduce_only=current_order.get('reduceOnly', False)
+            )
             
             if new_order:
-                logger.info(f"Stop order modified: {order_id} -> {new_order.get('orderId')}")
+                logger.info("Stop order modified: %s -> %s", order_id, new_order.get('orderId'))
                 return new_order
             else:
-                logger.error(f"Failed to place modified stop order for {order_id}")
+                logger.error("Failed to place modified stop order for %s", order_id)
                 return None
                 
         except Exception as e:
@@ -333,7 +455,9 @@ class StopLimitOrderHandler:
             response = self.client.cancel_order(symbol, order_id=order_id)
             
             if response:
-                logger.info(f"Stop order cancelled: {order_id}")
+                self._invalidate_stop_orders(symbol)
+                self._order_cache.pop(order_id, None)
+                logger.info("Stop order cancelled: %s", order_id)
                 log_trade(
                     logger,
                     'STOP_LIMIT',
@@ -345,11 +469,11 @@ class StopLimitOrderHandler:
                 )
                 return response
             else:
-                logger.error(f"Failed to cancel stop order: {order_id}")
+                logger.error("Failed to cancel stop order: %s", order_id)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error cancelling stop order: {str(e)}")
+            logger.error("Error cancelling stop order: %s", e)
             return None
     
     def get_stop_orders(self, symbol=None):
@@ -363,24 +487,71 @@ class StopLimitOrderHandler:
             list: List of stop orders
         """
         try:
+            cached = self._open_orders_cache.get(symbol)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+            
             orders = self.client.get_open_orders(symbol)
             
             if orders is not None:
                 # Filter stop orders
-                stop_orders = [
-                    order for order in orders 
-                    if order.get('type') in ['STOP', 'STOP_MARKET', 'TRAILING_STOP_MARKET']
-                ]
-                logger.info(f"Retrieved {len(stop_orders)} stop orders")
+                stop_orders = [order for order in orders if order.get('type') in _STOP_TYPES]
+                self._open_orders_cache[symbol] = (time.monotonic(), stop_orders)
+                logger.info("Retrieved %d stop orders", len(stop_orders))
                 return stop_orders
             else:
                 logger.error("Failed to retrieve stop orders")
                 return []
                 
         except Exception as e:
-            logger.error(f"Error getting stop orders: {str(e)}")
+            logger.error("Error getting stop orders: %s", e)
             return []
     
+    def _cache_order(self, order):
+        """
+        Remember an order response for later lookups
+        
+        Args:
+            order (dict): Order response with orderId
+        """
+        cache = self._order_cache
+        if len(cache) >= self.order_cache_maxsize:
+            # Dicts keep insertion order; drop the oldest entry
+            cache.pop(next(iter(cache)), None)
+        cache[order['orderId']] = (time.monotonic(), order)
+    
+    def _get_order(self, symbol, order_id, max_age=None):
+        """
+        Get an order from the local cache, falling back to a REST lookup
+        
+        Args:
+            symbol (str): Trading symbol
+            order_id (int): Order ID
+            max_age (float, optional): Oldest acceptable cached copy in seconds;
+                None accepts any age
+        
+        Returns:
+            dict: Order details or None if unavailable
+        """
+        cached = self._order_cache.get(order_id)
+        if cached is not None and (max_age is None or time.monotonic() - cached[0] < max_age):
+            return cached[1]
+        
+        order = self.client.get_order_status(symbol, order_id=order_id)
+        if order:
+            self._cache_order(order)
+        return order
+    
+    def _invalidate_stop_orders(self, symbol):
+        """
+        Drop cached stop orders after this handler changes them
+        
+        Args:
+            symbol (str): Trading symbol
+        """
+        self._open_orders_cache.pop(symbol, None)
+        self._open_orders_cache.pop(None, None)
+    
     def calculate_stop_levels(self, entry_price, position_side, risk_percentage=2.0, reward_ratio=2.0):
         """
         Calculate stop loss and take profit levels
@@ -395,32 +566,50 @@ class StopLimitOrderHandler:
             dict: Stop loss and take profit levels
         """
         try:
-            risk_amount = entry_price * (risk_percentage / 100)
-            reward_amount = risk_amount * reward_ratio
-            
-            if position_side.upper() == 'LONG':
-                stop_loss = entry_price - risk_amount
-                take_profit = entry_price + reward_amount
-            else:  # SHORT
-                stop_loss = entry_price + risk_amount
-                take_profit = entry_price - reward_amount
-            
+            # Anything other than LONG is treated as SHORT
+            sign = self._SIDE_SIGN.get(position_side.upper(), -1.0)
+            levels = _stop_level_arrays(
+                np.array([entry_price], dtype=np.float64), np.array([sign]),
+                risk_percentage, reward_ratio
+            )
             levels = {
-                'entry_price': entry_price,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit,
-                'risk_amount': risk_amount,
-                'reward_amount': reward_amount,
-                'risk_percentage': risk_percentage,
-                'reward_percentage': (reward_amount / entry_price) * 100,
-                'risk_reward_ratio': reward_ratio
+                key: value[0].item() if isinstance(value, np.ndarray) else value
+                for key, value in levels.items()
             }
             
-            logger.info(f"Stop levels calculated for {position_side}: SL={stop_loss:.4f}, TP={take_profit:.4f}")
+            logger.info("Stop levels calculated for %s: SL=%.4f, TP=%.4f",
+                        position_side, levels['stop_loss'], levels['take_profit'])
+            return levels
+            
+        except Exception as e:
+            logger.error("Error calculating stop levels: %s", e)
+            return {}
+    
+    def calculate_stop_levels_batch(self, entry_prices, sides, risk_percentage=2.0, reward_ratio=2.0):
+        """
+        Calculate stop loss and take profit levels for many positions at once
+        
+        Args:
+            entry_prices (array-like): Entry prices
+            sides (array-like): Position sides ('LONG' or 'SHORT')
+            risk_percentage (float): Risk percentage
+            reward_ratio (float): Risk-reward ratio
+        
+        Returns:
+            dict: Stop loss and take profit levels, one array per field
+        """
+        try:
+            sides = np.char.upper(np.asarray(sides, dtype=str))
+            levels = _stop_level_arrays(
+                np.asarray(entry_prices, dtype=np.float64), np.where(sides == 'LONG', 1.0, -1.0),
+                risk_percentage, reward_ratio
+            )
+            
+            logger.info("Stop levels calculated for %d positions", levels['entry_price'].size)
             return levels
             
         except Exception as e:
-            logger.error(f"Error calculating stop levels: {str(e)}")
+            logger.error("Error calculating batch stop levels: %s", e)
             return {}
     
     def create_bracket_stop_orders(self, symbol, entry_order_id, position_side, risk_percentage=2.0):
@@ -438,10 +627,10 @@ class StopLimitOrderHandler:
         """
         try:
             # Get entry order details
-            entry_order = self.client.get_order_status(symbol, order_id=entry_order_id)
+            entry_order = self._get_order(symbol, entry_order_id, max_age=self.order_cache_ttl)
             
             if not entry_order or entry_order.get('status') != 'FILLED':
-                logger.error(f"Entry order {entry_order_id} not filled yet")
+                logger.error("Entry order %s not filled yet", entry_order_id)
                 return {}
             
             entry_price = float(entry_order['avgPrice'])
@@ -453,23 +642,83 @@ class StopLimitOrderHandler:
             if not levels:
                 return {}
             
-            orders = {}
+            # Both legs close the position, so they trade against its side
+            is_long = position_side.upper() == 'LONG'
+            side, sl_multiplier = _SL_TABLE[is_long]
+            tp_multiplier = _TP_TABLE[is_long][1]
+            stop_loss = levels['stop_loss']
+            take_profit = levels['take_profit']
+            
+            # Off-grid prices are rejected, so round both legs to the symbol's tick/step
+            filters = self.client.get_symbol_filters(symbol) or {}
+            tick_size = filters.get('tick_size')
+            leg_base = {
+                'symbol': symbol,
+                'side': side,
+                'quantity': quantize(quantity, filters.get('step_size'), ROUND_DOWN),
+                'timeInForce': 'GTC',
+                'reduceOnly': 'true',
+                'workingType': 'MARK_PRICE'
+            }
+            legs = {
+                'stop_loss': {
+                    **leg_base,
+                    'type': 'STOP',
+                    'stopPrice': quantize(stop_loss, tick_size),
+                    'price': quantize(stop_loss * sl_multiplier, tick_size),
+                    'newClientOrderId': self.client.next_client_order_id('brk-')
+                },
+                'take_profit': {
+                    **leg_base,
+                    'type': 'TAKE_PROFIT',
+                    'stopPrice': quantize(take_profit, tick_size),
+                    'price': quantize(take_profit * tp_multiplier, tick_size),
+                    'newClientOrderId': self.client.next_client_order_id('brk-')
+                }
+            }
             
-            # Place stop loss
-            sl_order = self.place_stop_loss(symbol, quantity, levels['stop_loss'])
-            if sl_order:
-                orders['stop_loss'] = sl_order
+            # Both legs in one signed request
+            responses = self.client.place_orders_batch(list(legs.values())) or [{}, {}]
             
-            # Place take profit
-            tp_order = self.place_take_profit(symbol, quantity, levels['take_profit'])
-            if tp_order:
-                orders['take_profit'] = tp_order
+            # Retry legs the batch did not confirm, both at once
+            confirmed = dict(zip(legs, responses))
+            retries = {
+                name: self.client.io_executor.submit(self.client.recover_order, legs[name])
+                for name, response in confirmed.items() if 'orderId' not in response
+            }
+            results = {
+                name: retries[name].result() if name in retries else confirmed[name]
+                for name in legs
+            }
+            
+            # A take profit without its stop loss isn't a bracket; a lone stop loss still protects
+            if results['take_profit'] and not results['stop_loss']:
+                logger.error("Bracket stop-loss leg failed, cancelling take profit for %s", symbol)
+                self.cancel_stop_order(symbol, results['take_profit']['orderId'])
+                return {}
+            
+            orders = {}
+            for name, params in legs.items():
+                response = results[name]
+                if response:
+                    orders[name] = response
+                    log_trade(
+                        logger,
+                        'STOP_LIMIT',
+                        symbol,
+                        side,
+                        quantity,
+                        price=params['price'],
+                        order_id=response.get('orderId'),
+                        status=response.get('status', 'NEW')
+                    )
             
-            logger.info(f"Bracket stop orders created for {symbol}")
+            self._invalidate_stop_orders(symbol)
+            logger.info("Bracket stop orders created for %s", symbol)
             return orders
             
         except Exception as e:
-            logger.error(f"Error creating bracket stop orders: {str(e)}")
+            logger.error("Error creating bracket stop orders: %s", e)
             return {}
     
     def monitor_price_for_manual_stops(self, symbol, stop_conditions):
@@ -478,133 +727,304 @@ class StopLimitOrderHandler:
         
         Args:
             symbol (str): Trading symbol
-            stop_conditions (list): List of stop conditions
+            stop_conditions (list): StopCondition objects, or dicts with the same
+                fields (symbol defaults to the monitored symbol)
         
         Returns:
-            str: Monitor ID
+            str: Monitor ID, unique within the process
         """
         try:
-            monitor_id = f"MONITOR_{symbol}_{int(time.time())}"
+            monitor_id = f"MONITOR_{symbol}_{next(self._monitor_seq)}_{time.monotonic_ns()}"
+            conditions = [
+                condition if isinstance(condition, StopCondition)
+                else StopCondition(**{'symbol': symbol, **condition})
+                for condition in stop_conditions
+            ]
             
-            self.monitoring_orders[monitor_id] = {
-                'symbol': symbol,
-                'conditions': stop_conditions,
-                'active': True
-            }
-            
-            # Start monitoring thread if not already running
-            if not self.is_monitoring:
-                self.is_monitoring = True
-                self.monitor_thread = threading.Thread(
-                    target=self._price_monitor_loop,
-                    daemon=True
+            with self._monitor_lock:
+                self.monitoring_orders[monitor_id] = _Monitor(symbol, conditions)
+                
+                is_new_symbol = symbol not in self._triggers_by_symbol
+                triggers = self._triggers_by_symbol.setdefault(
+                    symbol, {'above': (array('d'), []), 'below': (array('d'), [])}
                 )
-                self.monitor_thread.start()
+                for condition in conditions:
+                    trigger_type = condition.trigger_type
+                    if trigger_type not in triggers:
+                        logger.warning("Ignoring stop condition with unknown trigger type: %s", trigger_type)
+                        continue
+                    
+                    key = condition.trigger_price if trigger_type == 'above' else -condition.trigger_price
+                    keys, entries = triggers[trigger_type]
+                    i = bisect.bisect_right(keys, key)
+                    keys.insert(i, key)
+                    entries.insert(i, (monitor_id, condition))
+                
+                if not (triggers['above'][0] or triggers['below'][0]):
+                    del self._triggers_by_symbol[symbol]
+                    is_new_symbol = False
+                
+                # Decided under the lock the watchdog exits under, so exactly one
+                # loop runs and it never exits past a condition added here
+                start_watchdog = not self.is_monitoring
+                self.is_monitoring = True
+                
+                # A live stream picks the symbol up now; otherwise the watchdog subscribes
+                # on connect. Sent under the lock so it is ordered with _on_price's unsubscribe
+                if is_new_symbol and self.price_stream is not None and self.price_stream.is_connected():
+                    self.price_stream.subscribe_book_ticker(symbol, self._on_book_ticker)
             
-            logger.info(f"Price monitoring started for {symbol}: {monitor_id}")
+            # New conditions may be nearer than the REST fallback's next scheduled check
+            event_loop = self.client.get_event_loop()
+            event_loop.call_soon(self._poll_schedule.clear)
+            
+            # Start the watchdog if not already running
+            if start_watchdog:
+                self.monitor_task = event_loop.submit(self._price_monitor_loop())
+            
+            logger.info("Price monitoring started for %s: %s", symbol, monitor_id)
             return monitor_id
             
         except Exception as e:
-            logger.error(f"Error starting price monitoring: {str(e)}")
+            logger.error("Error starting price monitoring: %s", e)
             return None
     
-    def _price_monitor_loop(self):
+    async def _price_monitor_loop(self):
         """
-        Main price monitoring loop
+        Watchdog for the price stream
+        
+        Stop conditions are evaluated as bookTicker updates arrive; this loop
+        only keeps the stream connected and falls back to REST polling while
+        it is down. Blocking calls run in the loop's default executor, so the
+        fallback polls every symbol concurrently.
         """
+        loop = asyncio.get_running_loop()
+        connect = None
+        stream = None
+        exited = False
         try:
-            while self.is_monitoring and self.monitoring_orders:
-                for monitor_id, monitor_data in list(self.monitoring_orders.items()):
-                    if not monitor_data['active']:
-                        continue
-                    
-                    symbol = monitor_data['symbol']
-                    conditions = monitor_data['conditions']
-                    
-                    # Get current price
-                    ticker = self.client.get_ticker(symbol)
-                    if not ticker:
+            while True:
+                if connect is not None and not self.monitoring_orders:
+                    # Let an in-flight connect settle so it can't install a stream after teardown
+                    await asyncio.wait([connect])
+                    connect = None
+                
+                with self._monitor_lock:
+                    if not self.monitoring_orders:
+                        self.is_monitoring = False
+                        stream, self.price_stream = self.price_stream, None
+                        exited = True
+                        break
+                
+                if self.price_stream is not None and self.price_stream.is_connected():
+                    await asyncio.sleep(self.stream_check_interval)
+                    continue
+                
+                # Reconnect in the background; polling must not wait on the connect timeout
+                if connect is None:
+                    connect = loop.run_in_executor(None, self._ensure_price_stream)
+                elif connect.done():
+                    connected = connect.result()
+                    connect = None
+                    if connected:
+                        self._poll_schedule.clear()
                         continue
-                    
-                    current_price = float(ticker['price'])
-                    
-                    # Check conditions
-                    for condition in conditions:
-                        if self._check_stop_condition(current_price, condition):
-                            # Execute stop order
-                            self._execute_manual_stop(condition)
-                            
-                            # Remove executed condition
-                            conditions.remove(condition)
-                    
-                    # Remove monitor if no conditions left
-                    if not conditions:
-                        del self.monitoring_orders[monitor_id]
                 
-                time.sleep(1)  # Check every second
+                # Stream unavailable: poll the symbols that are due until it is back
+                next_deadline = await self._poll_due_prices(loop)
+                await asyncio.sleep(min(1.0, max(0.0, next_deadline - loop.time())))
                 
+        except asyncio.CancelledError:
+            logger.info("Price monitoring cancelled")
         except Exception as e:
-            logger.error(f"Error in price monitoring loop: {str(e)}")
+            logger.error("Error in price monitoring loop: %s", e)
         finally:
-            self.is_monitoring = False
+            # Cancelled or failed: release the flag so the next caller starts a new loop
+            if not exited:
+                with self._monitor_lock:
+                    self.is_monitoring = False
+                    stream, self.price_stream = self.price_stream, None
+            if stream is not None:
+                stream.disconnect()
     
-    def _check_stop_condition(self, current_price, condition):
+    async def _poll_due_prices(self, loop):
         """
-        Check if stop condition is met
+        Poll REST prices for every symbol whose scheduled check is due
         
         Args:
-            current_price (float): Current market price
-            condition (dict): Stop condition
+            loop: Running event loop
         
         Returns:
-            bool: True if condition is met
+            float: Loop time of the next scheduled check
         """
-        try:
-            trigger_price = condition['trigger_price']
-            trigger_type = condition['trigger_type']  # 'above' or 'below'
-            
-            if trigger_type == 'above':
-                return current_price >= trigger_price
-            elif trigger_type == 'below':
-                return current_price <= trigger_price
+        now = loop.time()
+        schedule = self._poll_schedule
+        
+        # Newly monitored symbols are due immediately
+        scheduled = {symbol for _, symbol in schedule}
+        for symbol in list(self._triggers_by_symbol):
+            if symbol not in scheduled:
+                heapq.heappush(schedule, (now, symbol))
+        
+        due = []
+        while schedule and schedule[0][0] <= now:
+            symbol = heapq.heappop(schedule)[1]
+            if symbol in self._triggers_by_symbol:
+                due.append(symbol)
+        
+        tickers = await asyncio.gather(*(
+            loop.run_in_executor(None, self.client.get_ticker, symbol) for symbol in due
+        ))
+        for symbol, ticker in zip(due, tickers):
+            delay = 1.0
+            if ticker:
+                price = float(ticker['lastPrice'])
+                self._on_price(symbol, price)
+                delay = self._poll_delay(symbol, price)
+            if symbol in self._triggers_by_symbol:
+                heapq.heappush(schedule, (loop.time() + delay, symbol))
+        
+        return schedule[0][0] if schedule else now + 1.0
+    
+    def close(self):
+        """Stop the price watchdog and disconnect its stream"""
+        with self._monitor_lock:
+            monitor_task = self.monitor_task
+            stream, self.price_stream = self.price_stream, None
+        if monitor_task is not None:
+            monitor_task.cancel()
+        if stream is not None:
+            stream.disconnect()
+    
+    def _poll_delay(self, symbol, price):
+        """
+        Time until a symbol's next REST price check, from the distance to its nearest trigger
+        
+        Args:
+            symbol (str): Trading symbol
+            price (float): Last polled price
+        
+        Returns:
+            float: Delay in seconds
+        """
+        with self._monitor_lock:
+            triggers = self._triggers_by_symbol.get(symbol)
+            if triggers is None:
+                return self.max_poll_interval
             
+            # The first sorted key of each direction is the nearest unfired trigger
+            nearest = [abs(triggers['above'][0][0] - price)] if triggers['above'][0] else []
+            if triggers['below'][0]:
+                nearest.append(abs(-triggers['below'][0][0] - price))
+        
+        if not nearest or price <= 0:
+            return self.min_poll_interval
+        
+        gap_pct = min(nearest) / price * 100
+        return min(self.max_poll_interval, max(self.min_poll_interval, gap_pct * self.poll_secs_per_pct))
+    
+    def _ensure_price_stream(self):
+        """
+        Connect the bookTicker stream if needed and subscribe every monitored symbol
+        
+        Returns:
+            bool: True if the stream is connected
+        """
+        if self.price_stream is not None and self.price_stream.is_connected():
+            return True
+        
+        if self.price_stream is None:
+            self.price_stream = WebSocketClient(testnet=self.client.testnet)
+        
+        if not self.price_stream.connect():
+            logger.warning("Price stream unavailable, polling REST for manual stops")
             return False
+        
+        for symbol in list(self._triggers_by_symbol):
+            self.price_stream.subscribe_book_ticker(symbol, self._on_book_ticker)
+        return True
+    
+    def _on_book_ticker(self, data):
+        """
+        Evaluate stop conditions against a bookTicker update
+        
+        Args:
+            data (dict): bookTicker payload with symbol, best bid and best ask
+        """
+        self._on_price(data['s'], (float(data['b']) + float(data['a'])) / 2)
+    
+    def _on_price(self, symbol, current_price):
+        """
+        Fire every stop condition for a symbol that the price has reached
+        
+        Args:
+            symbol (str): Trading symbol
+            current_price (float): Current market price
+        """
+        with self._monitor_lock:
+            triggers = self._triggers_by_symbol.get(symbol)
+            if triggers is None:
+                return
             
-        except Exception as e:
-            logger.error(f"Error checking stop condition: {str(e)}")
-            return False
+            # 'above' fires for trigger <= price, 'below' for -trigger <= -price
+            triggered = []
+            for trigger_type, bound in (('above', current_price), ('below', -current_price)):
+                keys, entries = triggers[trigger_type]
+                k = bisect.bisect_right(keys, bound)
+                if k:
+                    triggered.extend(entries[:k])
+                    del keys[:k]
+                    del entries[:k]
+            
+            if not triggered:
+                return
+            
+            # Unsubscribed under the lock, so a concurrent monitor for this symbol
+            # either sees it still subscribed or subscribes again after this
+            if not (triggers['above'][0] or triggers['below'][0]):
+                del self._triggers_by_symbol[symbol]
+                if self.price_stream is not None and self.price_stream.is_connected():
+                    self.price_stream.unsubscribe(f"{symbol.lower()}@bookTicker")
+            
+            for monitor_id, condition in triggered:
+                monitor_data = self.monitoring_orders.get(monitor_id)
+                if monitor_data is None:
+                    continue
+                monitor_data.conditions.remove(condition)
+                
+                # Remove monitor if no conditions left
+                if not monitor_data.conditions:
+                    del self.monitoring_orders[monitor_id]
+        
+        for _, condition in triggered:
+            # Placed off the WebSocket thread
+            self.client.io_executor.submit(self._execute_manual_stop, condition)
     
     def _execute_manual_stop(self, condition):
         """
         Execute manual stop order
         
         Args:
-            condition (dict): Stop condition with order details
+            condition (StopCondition): Stop condition with order details
         """
         try:
-            symbol = condition['symbol']
-            side = condition['side']
-            quantity = condition['quantity']
-            order_type = condition.get('order_type', 'MARKET')
-            
-            if order_type == 'MARKET':
-                from ..market_orders import MarketOrderHandler
-                market_handler = MarketOrderHandler(self.client)
-                response = market_handler.place_order(symbol, side, quantity)
+            if condition.order_type == 'MARKET':
+                response = self.market_handler.place_order(
+                    condition.symbol, condition.side, condition.quantity
+                )
             else:
-                limit_price = condition.get('limit_price')
                 response = self.client.place_order(
-                    symbol=symbol,
-                    side=side,
+                    symbol=condition.symbol,
+                    side=condition.side,
                     order_type='LIMIT',
-                    quantity=quantity,
-                    price=limit_price
+                    quantity=condition.quantity,
+                    price=condition.limit_price
                 )
             
             if response:
-                logger.info(f"Manual stop executed: {response.get('orderId')}")
+                logger.info("Manual stop executed: %s", response.get('orderId'))
             else:
                 logger.error("Failed to execute manual stop")
                 
         except Exception as e:
-            logger.error(f"Error executing manual stop: {str(e)}")
+            logger.error("Error executing manual stop: %s", e)
@@ -3,15 +3,46 @@ TWAP (Time-Weighted Average Price) order handler
 Splits large orders into smaller chunks executed over time
 """
 
+import asyncio
 import time
 import threading
 import math
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from ._precision import quantize
 from ..logger import setup_logger, log_trade, log_error
 from ..market_orders import MarketOrderHandler
 
 logger = setup_logger()
 
+@dataclass(slots=True)
+class TWAPState:
+    """Configuration and progress of one TWAP; lock guards the fill counters"""
+    twap_id: str
+    symbol: str
+    side: str
+    total_quantity: float
+    quantity_per_interval: float
+    duration_minutes: float
+    intervals: int
+    interval_duration: float
+    order_type: str
+    limit_price: float
+    start_time: datetime
+    executed_quantity: float = 0
+    executed_intervals: int = 0
+    orders: list = field(default_factory=list)
+    # Running VWAP numerator and denominator, updated per fill
+    fill_notional: float = 0.0
+    fill_quantity: float = 0.0
+    first_fill_price: float = None
+    status: str = 'RUNNING'
+    task: object = None
+    end_time: datetime = None
+    filters: dict = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
 class TWAPOrderHandler:
     def __init__(self, binance_client):
         """
@@ -22,12 +53,21 @@ class TWAPOrderHandler:
         """
         self.client = binance_client
         self.market_handler = MarketOrderHandler(binance_client)
+        # Readers iterate a snapshot taken under _lock, so inserts and
+        # removals on other threads never invalidate their iteration
         self.active_twaps = {}
         self.twap_counter = 0
+        self._lock = threading.RLock()
+        
+        # Short-lived per-symbol tickers; concurrent TWAPs on one symbol share a fetch
+        self.ticker_ttl = 0.5
+        self._ticker_cache = {}
+        self._ticker_locks = {}
+        
         logger.info("TWAP order handler initialized")
     
     def start_twap(self, symbol, side, total_quantity, duration_minutes, intervals, 
-                   order_type='MARKET', limit_price=None):
+                   order_type='MARKET', limit_price=None, start_at=None):
         """
         Start TWAP execution
         
@@ -39,41 +79,45 @@ class TWAPOrderHandler:
             intervals (int): Number of intervals
             order_type (str): Order type ('MARKET' or 'LIMIT')
             limit_price (float, optional): Limit price for limit orders
+            start_at (float, optional): Event loop time to anchor the interval schedule to
         
         Returns:
             str: TWAP ID or None if failed
         """
         try:
-            # Generate unique TWAP ID
-            self.twap_counter += 1
-            twap_id = f"TWAP_{self.twap_counter}_{int(time.time())}"
-            
             # Calculate TWAP parameters
             quantity_per_interval = total_quantity / intervals
             interval_duration = duration_minutes / intervals
             
-            # Create TWAP configuration
-            twap_config = {
-                'twap_id': twap_id,
-                'symbol': symbol,
-                'side': side,
-                'total_quantity': total_quantity,
-                'quantity_per_interval': quantity_per_interval,
-                'duration_minutes': duration_minutes,
-                'intervals': intervals,
-                'interval_duration': interval_duration,
-                'order_type': order_type,
-                'limit_price': limit_price,
-                'start_time': datetime.now(),
-                'executed_quantity': 0,
-                'executed_intervals': 0,
-                'orders': [],
-                'status': 'RUNNING',
-                'stop_requested': False
-            }
-            
-            # Store TWAP configuration
-            self.active_twaps[twap_id] = twap_config
+            # Tick/step sizes are fixed for the TWAP's lifetime; fetch them once and
+            # put every slice on the step grid up front rather than per interval
+            filters = self.client.get_symbol_filters(symbol)
+            if filters:
+                quantity_per_interval = float(quantize(quantity_per_interval, filters['step_size'], ROUND_DOWN))
+                if quantity_per_interval <= 0:
+                    raise ValueError(f"Quantity per interval is below the step size {filters['step_size']}")
+            
+            with self._lock:
+                # Generate unique TWAP ID
+                self.twap_counter += 1
+                twap_id = f"TWAP_{self.twap_counter}_{int(time.time())}"
+                
+                # Create and store TWAP state
+                twap_state = TWAPState(
+                    twap_id=twap_id,
+                    symbol=symbol,
+                    side=side,
+                    total_quantity=total_quantity,
+                    quantity_per_interval=quantity_per_interval,
+                    duration_minutes=duration_minutes,
+                    intervals=intervals,
+                    interval_duration=interval_duration,
+                    order_type=order_type,
+                    limit_price=limit_price,
+                    start_time=datetime.now(),
+                    filters=filters
+                )
+                self.active_twaps[twap_id] = twap_state
             
             # Log TWAP start
             log_trade(
@@ -87,13 +131,8 @@ class TWAPOrderHandler:
                 status='STARTED'
             )
             
-            # Start TWAP execution in separate thread
-            twap_thread = threading.Thread(
-                target=self._execute_twap,
-                args=(twap_id,),
-                daemon=True
-            )
-            twap_thread.start()
+            # Schedule TWAP execution on the shared event loop
+            twap_state.task = self._execute_twap(twap_id, start_at)
             
             logger.info(f"TWAP started: {twap_id} - {total_quantity} {symbol} over {duration_minutes}m")
             return twap_id
@@ -114,89 +153,164 @@ class TWAPOrderHandler:
             )
             return None
     
-    def _execute_twap(self, twap_id):
+    def start_twaps(self, twaps):
+        """
+        Start several TWAPs on one common schedule
+        
+        All TWAPs share a start time, so slices with equal interval lengths
+        fire together and LIMIT slices on the same symbol share a ticker fetch.
+        
+        Args:
+            twaps (list): Dicts of start_twap keyword arguments
+        
+        Returns:
+            list: TWAP IDs, None for any that failed to start
+        """
+        start_at = self.client.get_event_loop().loop.time()
+        return [self.start_twap(**twap, start_at=start_at) for twap in twaps]
+    
+    def _execute_twap(self, twap_id, start_at=None):
+        """
+        Schedule TWAP execution on the client's shared event loop
+        
+        Args:
+            twap_id (str): TWAP identifier
+            start_at (float, optional): Loop time to anchor the schedule to
+        
+        Returns:
+            concurrent.futures.Future: Handle to the running TWAP coroutine
+        """
+        # Every TWAP runs as a coroutine on one loop, so slices due at the
+        # same moment wake in the same loop iteration
+        return self.client.get_event_loop().submit(self._execute_twap_async(twap_id, start_at))
+    
+    async def _execute_twap_async(self, twap_id, start_at=None):
         """
         Execute TWAP strategy
         
+        Order placement runs on the client's I/O executor so a slow REST
+        call on one TWAP never delays the others.
+        
         Args:
             twap_id (str): TWAP identifier
+            start_at (float, optional): Loop time to anchor the schedule to; now if omitted
         """
+        loop = asyncio.get_running_loop()
         try:
-            twap_config = self.active_twaps.get(twap_id)
-            if not twap_config:
+            twap_state = self.active_twaps.get(twap_id)
+            if not twap_state:
                 logger.error(f"TWAP configuration not found: {twap_id}")
                 return
             
-            symbol = twap_config['symbol']
-            side = twap_config['side']
-            quantity_per_interval = twap_config['quantity_per_interval']
-            interval_duration_seconds = twap_config['interval_duration'] * 60
-            order_type = twap_config['order_type']
-            limit_price = twap_config['limit_price']
+            interval_duration_seconds = twap_state.interval_duration * 60
             
-            logger.info(f"Executing TWAP {twap_id}: {twap_config['intervals']} intervals")
+            # Slices fire at fixed offsets from the start, so order latency
+            # never pushes later intervals back
+            start = loop.time() if start_at is None else start_at
             
-            for interval in range(twap_config['intervals']):
-                # Check if stop was requested
-                if twap_config['stop_requested']:
-                    logger.info(f"TWAP {twap_id} stopped by request")
-                    break
-                
+            logger.info(f"Executing TWAP {twap_id}: {twap_state.intervals} intervals")
+            
+            for interval in range(twap_state.intervals):
                 try:
-                    # Execute order for this interval
-                    if order_type == 'MARKET':
-                        order_response = self.market_handler.place_order(
-                            symbol, side, quantity_per_interval
-                        )
-                    else:  # LIMIT
-                        # For limit orders, we could use current market price + spread
-                        current_price = self._get_adaptive_price(symbol, side, limit_price)
-                        order_response = self._place_limit_order(
-                            symbol, side, quantity_per_interval, current_price
-                        )
-                    
-                    if order_response:
-                        # Update TWAP status
-                        twap_config['executed_quantity'] += quantity_per_interval
-                        twap_config['executed_intervals'] += 1
-                        twap_config['orders'].append(order_response)
-                        
-                        logger.info(f"TWAP {twap_id} interval {interval + 1} executed: {quantity_per_interval}")
-                    else:
-                        logger.error(f"TWAP {twap_id} interval {interval + 1} failed")
+                    await loop.run_in_executor(
+                        self.client.io_executor, self._execute_interval, twap_state, interval
+                    )
                     
                     # Wait for next interval (except for last one)
-                    if interval < twap_config['intervals'] - 1:
-                        time.sleep(interval_duration_seconds)
+                    if interval < twap_state.intervals - 1:
+                        target = start + (interval + 1) * interval_duration_seconds
+                        await asyncio.sleep(max(0.0, target - loop.time()))
                         
+                except asyncio.CancelledError:
+                    logger.info(f"TWAP {twap_id} stopped by request")
+                    break
                 except Exception as e:
                     logger.error(f"Error in TWAP interval {interval + 1}: {str(e)}")
                     continue
             
             # Mark TWAP as completed
-            twap_config['status'] = 'COMPLETED'
-            twap_config['end_time'] = datetime.now()
+            twap_state.status = 'COMPLETED'
+            twap_state.end_time = datetime.now()
             
             # Log completion
             log_trade(
                 logger,
                 'TWAP_COMPLETE',
-                symbol,
-                side,
-                twap_config['executed_quantity'],
+                twap_state.symbol,
+                twap_state.side,
+                twap_state.executed_quantity,
                 order_id=twap_id,
                 status='COMPLETED'
             )
             
-            logger.info(f"TWAP {twap_id} completed: {twap_config['executed_quantity']}/{twap_config['total_quantity']}")
+            logger.info(f"TWAP {twap_id} completed: {twap_state.executed_quantity}/{twap_state.total_quantity}")
             
         except Exception as e:
             error_msg = f"Error executing TWAP {twap_id}: {str(e)}"
             log_error(logger, 'TWAP_EXECUTION_ERROR', error_msg, {'twap_id': twap_id})
             
             # Mark as failed
-            if twap_id in self.active_twaps:
-                self.active_twaps[twap_id]['status'] = 'FAILED'
+            twap_state = self.active_twaps.get(twap_id)
+            if twap_state:
+                twap_state.status = 'FAILED'
+    
+    def _execute_interval(self, twap_state, interval):
+        """
+        Place one TWAP slice and record the fill
+        
+        Runs on an executor thread; bookkeeping happens here rather than in
+        the coroutine so a slice already sent is still recorded if the TWAP
+        is cancelled while the request is in flight.
+        
+        Args:
+            twap_state (TWAPState): TWAP to advance
+            interval (int): Zero-based interval index
+        """
+        symbol = twap_state.symbol
+        side = twap_state.side
+        quantity_per_interval = twap_state.quantity_per_interval
+        
+        # The last slice picks up what step-size rounding left off the others;
+        # subtract in Decimal so float error can't round it down a step
+        if twap_state.filters and interval == twap_state.intervals - 1:
+            remainder = (Decimal(repr(twap_state.total_quantity))
+                         - Decimal(repr(quantity_per_interval)) * (twap_state.intervals - 1))
+            quantity_per_interval = float(quantize(remainder, twap_state.filters['step_size'], ROUND_DOWN))
+            if quantity_per_interval <= 0:
+                logger.info(f"TWAP {twap_state.twap_id} interval {interval + 1} skipped: nothing left to execute")
+                return
+        
+        # Execute order for this interval
+        if twap_state.order_type == 'MARKET':
+            order_response = self.market_handler.place_order(
+                symbol, side, quantity_per_interval
+            )
+        else:  # LIMIT
+            # For limit orders, we could use current market price + spread
+            current_price = self._get_adaptive_price(symbol, side, twap_state.limit_price)
+            order_response = self._place_limit_order(
+                symbol, side, quantity_per_interval, current_price, twap_state.filters
+            )
+        
+        if order_response:
+            # Update TWAP status
+            # Market responses report price 0, so prefer the average fill price
+            fill_price = float(order_response.get('avgPrice') or 0) or float(order_response.get('price') or 0)
+            fill_quantity = float(order_response.get('executedQty') or 0)
+            
+            with twap_state.lock:
+                twap_state.executed_quantity += quantity_per_interval
+                twap_state.executed_intervals += 1
+                twap_state.orders.append(order_response)
+                if fill_price > 0 and fill_quantity > 0:
+                    twap_state.fill_notional += fill_price * fill_quantity
+                    twap_state.fill_quantity += fill_quantity
+                    if twap_state.first_fill_price is None:
+                        twap_state.first_fill_price = fill_price
+            
+            logger.info(f"TWAP {twap_state.twap_id} interval {interval + 1} executed: {quantity_per_interval}")
+        else:
+            logger.error(f"TWAP {twap_state.twap_id} interval {interval + 1} failed")
     
     def _get_adaptive_price(self, symbol, side, base_price):
         """
@@ -212,11 +326,11 @@ class TWAPOrderHandler:
         """
         try:
             # Get current market price
-            ticker = self.client.get_ticker(symbol)
+            ticker = self._get_ticker(symbol)
             if not ticker:
                 return base_price
             
-            market_price = float(ticker['price'])
+            market_price = float(ticker['lastPrice'])
             
             # Adjust price based on market movement
             if side == 'BUY':
@@ -232,7 +346,35 @@ class TWAPOrderHandler:
             logger.error(f"Error getting adaptive price: {str(e)}")
             return base_price
     
-    def _place_limit_order(self, symbol, side, quantity, price):
+    def _get_ticker(self, symbol):
+        """
+        Get a ticker no older than ticker_ttl seconds
+        
+        Callers arriving while a fetch is in flight wait for it and reuse
+        its result instead of sending their own request.
+        
+        Args:
+            symbol (str): Trading symbol
+        
+        Returns:
+            dict: Ticker data or None if failed
+        """
+        cached = self._ticker_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self.ticker_ttl:
+            return cached[1]
+        
+        with self._ticker_locks.setdefault(symbol, threading.Lock()):
+            # Another thread may have refreshed it while we waited
+            cached = self._ticker_cache.get(symbol)
+            if cached is not None and time.monotonic() - cached[0] < self.ticker_ttl:
+                return cached[1]
+            
+            ticker = self.client.get_ticker(symbol)
+            if ticker:
+                self._ticker_cache[symbol] = (time.monotonic(), ticker)
+            return ticker
+    
+    def _place_limit_order(self, symbol, side, quantity, price, filters=None):
         """
         Place limit order for TWAP interval
         
@@ -241,11 +383,16 @@ class TWAPOrderHandler:
             side (str): Order side
             quantity (float): Order quantity
             price (float): Limit price
+            filters (dict, optional): Symbol filters from get_symbol_filters
         
         Returns:
             dict: Order response
         """
         try:
+            if filters:
+                # Round toward the passive side so the limit is never exceeded
+                price = quantize(price, filters['tick_size'], ROUND_DOWN if side == 'BUY' else ROUND_UP)
+            
             return self.client.place_order(
                 symbol=symbol,
                 side=side,
@@ -269,13 +416,16 @@ class TWAPOrderHandler:
             bool: True if stopped successfully, False otherwise
         """
         try:
-            if twap_id not in self.active_twaps:
+            twap_state = self.active_twaps.get(twap_id)
+            if not twap_state:
                 logger.error(f"TWAP not found: {twap_id}")
                 return False
             
-            twap_config = self.active_twaps[twap_id]
-            twap_config['stop_requested'] = True
-            twap_config['status'] = 'STOPPED'
+            twap_state.status = 'STOPPED'
+            
+            # Interrupts the pending sleep; an in-flight slice still completes
+            if twap_state.task:
+                twap_state.task.cancel()
             
             logger.info(f"TWAP stop requested: {twap_id}")
             
@@ -283,9 +433,9 @@ class TWAPOrderHandler:
             log_trade(
                 logger,
                 'TWAP_STOP',
-                twap_config['symbol'],
-                twap_config['side'],
-                twap_config['executed_quantity'],
+                twap_state.symbol,
+                twap_state.side,
+                twap_state.executed_quantity,
                 order_id=twap_id,
                 status='STOPPED'
             )
@@ -307,72 +457,69 @@ class TWAPOrderHandler:
             dict: TWAP status information
         """
         try:
-            if twap_id not in self.active_twaps:
+            twap_state = self.active_twaps.get(twap_id)
+            if not twap_state:
                 return None
             
-            twap_config = self.active_twaps[twap_id]
-            
-            # Calculate progress
-            progress_percentage = (twap_config['executed_intervals'] / twap_config['intervals']) * 100
-            quantity_percentage = (twap_config['executed_quantity'] / twap_config['total_quantity']) * 100
-            
-            # Calculate VWAP (Volume Weighted Average Price)
-            vwap = self._calculate_vwap(twap_config['orders'])
-            
-            status_info = {
-                'twap_id': twap_id,
-                'status': twap_config['status'],
-                'symbol': twap_config['symbol'],
-                'side': twap_config['side'],
-                'total_quantity': twap_config['total_quantity'],
-                'executed_quantity': twap_config['executed_quantity'],
-                'remaining_quantity': twap_config['total_quantity'] - twap_config['executed_quantity'],
-                'progress_percentage': progress_percentage,
-                'quantity_percentage': quantity_percentage,
-                'executed_intervals': twap_config['executed_intervals'],
-                'total_intervals': twap_config['intervals'],
-                'vwap': vwap,
-                'start_time': twap_config['start_time'],
-                'orders_count': len(twap_config['orders'])
-            }
-            
-            return status_info
+            return self._status_info(twap_state)
             
         except Exception as e:
             logger.error(f"Error getting TWAP status: {str(e)}")
             return None
     
-    def _calculate_vwap(self, orders):
+    def _status_info(self, twap_state):
         """
-        Calculate Volume Weighted Average Price from executed orders
+        Build the status dict for a TWAP; O(1) regardless of order count
         
         Args:
-            orders (list): List of executed orders
+            twap_state (TWAPState): TWAP to report on
         
         Returns:
-            float: VWAP or None if no orders
+            dict: TWAP status information
         """
-        try:
-            if not orders:
-                return None
-            
-            total_value = 0
-            total_quantity = 0
-            
-            for order in orders:
-                if order and 'price' in order and 'executedQty' in order:
-                    price = float(order['price'])
-                    quantity = float(order['executedQty'])
-                    total_value += price * quantity
-                    total_quantity += quantity
-            
-            if total_quantity > 0:
-                return total_value / total_quantity
-            else:
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error calculating VWAP: {str(e)}")
+        # Consistent view of the fill counters
+        with twap_state.lock:
+            executed_quantity = twap_state.executed_quantity
+            executed_intervals = twap_state.executed_intervals
+            orders_count = len(twap_state.orders)
+        
+        # Calculate progress
+        progress_percentage = (executed_intervals / twap_state.intervals) * 100
+        quantity_percentage = (executed_quantity / twap_state.total_quantity) * 100
+        
+        # Calculate VWAP (Volume Weighted Average Price)
+        vwap = self._calculate_vwap(twap_state)
+        
+        return {
+            'twap_id': twap_state.twap_id,
+            'status': twap_state.status,
+            'symbol': twap_state.symbol,
+            'side': twap_state.side,
+            'total_quantity': twap_state.total_quantity,
+            'executed_quantity': executed_quantity,
+            'remaining_quantity': twap_state.total_quantity - executed_quantity,
+            'progress_percentage': progress_percentage,
+            'quantity_percentage': quantity_percentage,
+            'executed_intervals': executed_intervals,
+            'total_intervals': twap_state.intervals,
+            'vwap': vwap,
+            'start_time': twap_state.start_time,
+            'orders_count': orders_count
+        }
+    
+    def _calculate_vwap(self, twap_state):
+        """
+        Calculate Volume Weighted Average Price from the running fill totals
+        
+        Args:
+            twap_state (TWAPState): TWAP whose fills to average
+        
+        Returns:
+            float: VWAP or None if nothing has filled
+        """
+        with twap_state.lock:
+            if twap_state.fill_quantity > 0:
+                return twap_state.fill_notional / twap_state.fill_quantity
             return None
     
     def get_all_active_twaps(self):
@@ -385,9 +532,12 @@ class TWAPOrderHandler:
         try:
             active_twaps = {}
             
-            for twap_id, config in self.active_twaps.items():
-                if config['status'] in ['RUNNING', 'STOPPED']:
-                    active_twaps[twap_id] = self.get_twap_status(twap_id)
+            with self._lock:
+                snapshot = list(self.active_twaps.items())
+            
+            for twap_id, twap_state in snapshot:
+                if twap_state.status in ['RUNNING', 'STOPPED']:
+                    active_twaps[twap_id] = self._status_info(twap_state)
             
             return active_twaps
             
@@ -405,18 +555,22 @@ class TWAPOrderHandler:
         try:
             completed_twaps = []
             
-            for twap_id, config in self.active_twaps.items():
-                if config['status'] in ['COMPLETED', 'FAILED']:
+            with self._lock:
+                snapshot = list(self.active_twaps.items())
+            
+            for twap_id, twap_state in snapshot:
+                if twap_state.status in ['COMPLETED', 'FAILED']:
                     # Keep completed TWAPs for a while before cleanup
-                    if 'end_time' in config:
-                        time_diff = datetime.now() - config['end_time']
+                    if twap_state.end_time is not None:
+                        time_diff = datetime.now() - twap_state.end_time
                         if time_diff > timedelta(hours=1):  # Clean up after 1 hour
                             completed_twaps.append(twap_id)
             
             # Remove completed TWAPs
-            for twap_id in completed_twaps:
-                del self.active_twaps[twap_id]
-                logger.info(f"Cleaned up completed TWAP: {twap_id}")
+            with self._lock:
+                for twap_id in completed_twaps:
+                    self.active_twaps.pop(twap_id, None)
+                    logger.info(f"Cleaned up completed TWAP: {twap_id}")
             
             return len(completed_twaps)
             
@@ -435,22 +589,20 @@ class TWAPOrderHandler:
             dict: Performance metrics
         """
         try:
-            if twap_id not in self.active_twaps:
+            twap_state = self.active_twaps.get(twap_id)
+            if not twap_state:
                 return {}
             
-            twap_config = self.active_twaps[twap_id]
-            orders = twap_config['orders']
+            with twap_state.lock:
+                executed_quantity = twap_state.executed_quantity
+                orders_count = len(twap_state.orders)
+                benchmark_price = twap_state.first_fill_price
             
-            if not orders:
+            if not orders_count:
                 return {}
             
             # Calculate metrics
-            vwap = self._calculate_vwap(orders)
-            
-            # Get benchmark price (first order price)
-            benchmark_price = None
-            if orders and 'price' in orders[0]:
-                benchmark_price = float(orders[0]['price'])
+            vwap = self._calculate_vwap(twap_state)
             
             # Calculate slippage
             slippage = 0
@@ -459,8 +611,8 @@ class TWAPOrderHandler:
             
             # Calculate execution time
             execution_time = 0
-            if 'end_time' in twap_config:
-                execution_time = (twap_config['end_time'] - twap_config['start_time']).total_seconds()
+            if twap_state.end_time is not None:
+                execution_time = (twap_state.end_time - twap_state.start_time).total_seconds()
             
             performance = {
                 'twap_id': twap_id,
@@ -468,9 +620,9 @@ class TWAPOrderHandler:
                 'benchmark_price': benchmark_price,
                 'slippage_percentage': slippage,
                 'execution_time_seconds': execution_time,
-                'orders_executed': len(orders),
-                'average_order_size': twap_config['executed_quantity'] / len(orders) if orders else 0,
-                'completion_rate': (twap_config['executed_quantity'] / twap_config['total_quantity']) * 100
+                'orders_executed': orders_count,
+                'average_order_size': executed_quantity / orders_count,
+                'completion_rate': (executed_quantity / twap_state.total_quantity) * 100
             }
             
             return performance
@@ -2,17 +2,114 @@
 Binance Futures API client for trading operations
 """
 
+import asyncio
 import hashlib
 import hmac
+import itertools
+import socket
+import threading
 import time
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode
 from .logger import setup_logger
+from .websocket_client import UserDataStream, WsTradeSession
+
+# orjson is optional; it decodes large responses such as klines several times faster
+# and encodes batch payloads
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
 
 logger = setup_logger()
 
+class EventLoopThread:
+    """Event loop running in a daemon thread, for scheduling coroutines from synchronous code"""
+    
+    def __init__(self, name='event-loop', executor=None):
+        """
+        Start the loop thread
+        
+        Args:
+            name (str): Thread name
+            executor (Executor, optional): Default executor for run_in_executor(None, ...)
+        """
+        self.loop = asyncio.new_event_loop()
+        if executor is not None:
+            self.loop.set_default_executor(executor)
+        self._thread = threading.Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+    
+    def submit(self, coro):
+        """
+        Schedule a coroutine on the loop from any thread
+        
+        Args:
+            coro (coroutine): Coroutine to run
+        
+        Returns:
+            concurrent.futures.Future: Handle to the running coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def call_soon(self, callback, *args):
+        """Run a callback on the loop's thread"""
+        self.loop.call_soon_threadsafe(callback, *args)
+    
+    def stop(self, timeout=5):
+        """
+        Cancel every task on the loop, then stop it and its thread
+        
+        Args:
+            timeout (float): Seconds to wait for tasks to unwind
+        """
+        if not self._thread.is_alive():
+            return
+        
+        async def cancel_tasks():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if threading.current_thread() is not self._thread:
+            try:
+                self.submit(cancel_tasks()).result(timeout)
+            except Exception as e:
+                logger.warning(f"Event loop tasks did not stop cleanly: {str(e)}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets disable Nagle and enable TCP keepalive"""
+    
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 class BinanceClient:
+    # Matches the adapter's pool_maxsize so every async caller gets a pooled socket
+    POOL_SIZE = 32
+    
     def __init__(self, api_key, api_secret, testnet=True):
         """
         Initialize Binance Futures client
@@ -24,35 +121,82 @@ class BinanceClient:
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        self.testnet = testnet
+        
+        # User data stream shared by every order handler, started on first use
+        self._user_stream = None
+        self._user_stream_lock = threading.Lock()
+        
+        # WebSocket API trade session, connected on first use
+        self._ws_trade = None
+        self._ws_trade_lock = threading.Lock()
+        self._ws_trade_retry_at = 0
+        
+        # Exponential moving average of request round-trip time, in milliseconds
+        self.rtt_ema_alpha = 0.2
+        self._rtt_ms = None
+        
+        # Per-symbol tick/step sizes, loaded from one exchangeInfo call per session
+        self._symbol_filters = {}
+        
+        # Sequential clientOrderIds; the start-time prefix keeps them unique across restarts
+        self._client_order_seq = itertools.count(1)
+        self._client_order_prefix = f"{int(time.time()):x}"
+        
+        # Keyed once; each signature copies this instead of re-deriving the key pads
+        self._hmac_base = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
         
         if testnet:
             self.base_url = "https://testnet.binancefuture.com"
         else:
             self.base_url = "https://fapi.binance.com"
         
+        # One host, so one pool; keep enough sockets for concurrent order handlers
         self.session = requests.Session()
+        self.session.mount('https://', _KeepAliveAdapter(pool_connections=1, pool_maxsize=self.POOL_SIZE, max_retries=0))
         self.session.headers.update({
             'X-MBX-APIKEY': self.api_key,
             'Content-Type': 'application/json'
         })
         
+        # Worker threads for the *_async methods, one per pooled socket
+        self.io_executor = ThreadPoolExecutor(max_workers=self.POOL_SIZE, thread_name_prefix='binance-io')
+        
+        # One loop for every order handler's background coroutines, started on first use
+        self._event_loop = None
+        self._event_loop_lock = threading.Lock()
+        
+        # Server clock minus local clock, applied to every signed timestamp so
+        # local drift never trips recvWindow; resynced every clock_sync_interval
+        self.clock_sync_interval = 300
+        self._clock_offset_ms = 0
+        self._clock_synced_at = 0
+        self._clock_lock = threading.Lock()
+        
+        # Keep the pool warm once the client is in use; idle sockets are otherwise
+        # dropped between sparse orders. The thread and the first clock sync start
+        # on the first request, so constructing a client costs no I/O
+        self.keepalive_interval = 4
+        self._last_request = 0
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread = None
+        self._start_lock = threading.Lock()
+        
         logger.info(f"Binance client initialized - Testnet: {testnet}")
     
-    def _generate_signature(self, params):
-        """Generate HMAC SHA256 signature for API requests"""
-        query_string = urlencode(params)
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+    def _sign(self, query_string):
+        """Generate HMAC SHA256 signature for an encoded query string"""
+        # URL-encoded query strings are pure ASCII
+        signer = self._hmac_base.copy()
+        signer.update(query_string.encode('ascii'))
+        return signer.hexdigest()
     
     def _make_request(self, method, endpoint, params=None, signed=False):
         """
         Make API request to Binance
         
         Args:
-            method (str): HTTP method (GET, POST, DELETE)
+            method (str): HTTP method (GET, POST, PUT, DELETE)
             endpoint (str): API endpoint
             params (dict): Request parameters
             signed (bool): Whether request needs signature
@@ -63,38 +207,272 @@ class BinanceClient:
         if params is None:
             params = {}
         
+        # Encode once and sign that exact string rather than letting requests re-encode
         if signed:
-            params['timestamp'] = int(time.time() * 1000)
-            params['signature'] = self._generate_signature(params)
+            return self._make_signed_query(method, endpoint, urlencode(params))
         
         url = f"{self.base_url}{endpoint}"
+        return self._send(method, endpoint, url, params)
+    
+    async def _make_request_async(self, method, endpoint, params=None, signed=False):
+        """
+        Awaitable _make_request for callers running on an event loop
+        
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            endpoint (str): API endpoint
+            params (dict): Request parameters
+            signed (bool): Whether request needs signature
+        
+        Returns:
+            dict: API response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.io_executor, self._make_request, method, endpoint, params, signed
+        )
+    
+    def _make_signed_query(self, method, endpoint, query_string):
+        """
+        Sign and send a request whose parameters are already URL-encoded
+        
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            endpoint (str): API endpoint
+            query_string (str): Encoded parameters without timestamp/signature
+        
+        Returns:
+            dict: API response
+        """
+        timestamp = f"timestamp={self.timestamp_ms()}"
+        query_string = f"{query_string}&{timestamp}" if query_string else timestamp
+        signature = self._sign(query_string)
+        
+        url = f"{self.base_url}{endpoint}?{query_string}&signature={signature}"
+        return self._send(method, endpoint, url)
+    
+    def _sign_qs(self, parts):
+        """
+        Build a signed query string straight from (key, value) pairs
+        
+        Values are joined as-is, so they must already be URL-safe (symbols,
+        IDs, numbers); skipping urlencode and the params dict keeps this path
+        to one join and one HMAC.
+        
+        Args:
+            parts (list): (key, value) pairs without timestamp/signature
+        
+        Returns:
+            str: Query string ending in timestamp and signature
+        """
+        fields = [f"{key}={value}" for key, value in parts]
+        fields.append(f"timestamp={self.timestamp_ms()}")
+        query_string = '&'.join(fields)
+        return f"{query_string}&signature={self._sign(query_string)}"
+    
+    def _sign_and_send(self, method, endpoint, parts):
+        """
+        Sign and send a request built from (key, value) pairs
+        
+        The timestamp and signature are added here; callers pass neither.
+        
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            endpoint (str): API endpoint
+            parts (list): URL-safe (key, value) pairs without timestamp/signature
+        
+        Returns:
+            dict: API response
+        """
+        url = f"{self.base_url}{endpoint}?{self._sign_qs(parts)}"
+        return self._send(method, endpoint, url)
+    
+    def _send(self, method, endpoint, url, params=None):
+        """
+        Send an HTTP request and decode the JSON response
+        
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            endpoint (str): API endpoint, used for logging
+            url (str): Full request URL
+            params (dict, optional): Query parameters
+        
+        Returns:
+            dict: API response or None if failed
+        """
+        if self._keepalive_thread is None:
+            self._start_keepalive()
+        
+        self._last_request = time.monotonic()
+        start = time.perf_counter()
         
         try:
             if method == 'GET':
                 response = self.session.get(url, params=params)
             elif method == 'POST':
                 response = self.session.post(url, params=params)
+            elif method == 'PUT':
+                response = self.session.put(url, params=params)
             elif method == 'DELETE':
                 response = self.session.delete(url, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
+            rtt_ms = (time.perf_counter() - start) * 1000
+            self._rtt_ms = rtt_ms if self._rtt_ms is None else self._rtt_ms + self.rtt_ema_alpha * (rtt_ms - self._rtt_ms)
+            
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             logger.debug(f"API request successful: {method} {endpoint}")
             return result
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, _JSONDecodeError) as e:
             logger.error(f"API request failed: {method} {endpoint} - {str(e)}")
             if hasattr(e, 'response') and e.response is not None:
                 try:
-                    error_data = e.response.json()
+                    error_data = _json_loads(e.response.content)
                     logger.error(f"API error response: {error_data}")
                 except:
                     logger.error(f"API error response: {e.response.text}")
             return None
     
+    def get_user_data_stream(self):
+        """
+        Get the shared user data stream, (re)connecting it if needed
+        
+        Binance hands out one listen key per account, so handlers share a
+        single stream and register listeners on it rather than opening their own.
+        
+        Returns:
+            UserDataStream: Connected stream, or None if unavailable
+        """
+        with self._user_stream_lock:
+            if self._user_stream is None:
+                self._user_stream = UserDataStream(self)
+            if self._user_stream.is_running or self._user_stream.start():
+                return self._user_stream
+            return None
+    
+    def get_ws_trade_session(self):
+        """
+        Get the shared WebSocket API trade session, connecting on first use
+        
+        Returns:
+            WsTradeSession: Connected session, or None if unavailable
+        """
+        with self._ws_trade_lock:
+            if self._ws_trade is not None and self._ws_trade.is_running:
+                return self._ws_trade
+            
+            # Don't stall every order on a connect timeout after a failure
+            if time.monotonic() < self._ws_trade_retry_at:
+                return None
+            
+            self._ws_trade = WsTradeSession(self)
+            if self._ws_trade.connect():
+                return self._ws_trade
+            
+            self._ws_trade_retry_at = time.monotonic() + 60
+            return None
+    
+    def rtt_ms(self):
+        """
+        Get the smoothed request round-trip time
+        
+        Returns:
+            float: RTT moving average in milliseconds, or None before the first response
+        """
+        return self._rtt_ms
+    
+    def timestamp_ms(self):
+        """
+        Get the current time on the server's clock for signed requests
+        
+        Returns:
+            int: Milliseconds since the epoch, corrected by the last clock sync
+        """
+        if not self._clock_synced_at:
+            # First signed request: concurrent callers wait for the one sync
+            with self._clock_lock:
+                if not self._clock_synced_at:
+                    self.sync_clock()
+        return time.time_ns() // 1_000_000 + self._clock_offset_ms
+    
+    def sync_clock(self):
+        """
+        Measure the server clock offset from one server time request
+        
+        The server's reading is compared against the midpoint of the request,
+        which cancels out symmetric network latency.
+        
+        Returns:
+            bool: True if the offset was updated, False otherwise
+        """
+        sent_ms = time.time_ns() // 1_000_000
+        server_time = self.get_server_time()
+        received_ms = time.time_ns() // 1_000_000
+        self._clock_synced_at = time.monotonic()
+        
+        if not server_time or 'serverTime' not in server_time:
+            logger.warning("Clock sync failed; keeping offset of %d ms", self._clock_offset_ms)
+            return False
+        
+        self._clock_offset_ms = server_time['serverTime'] - (sent_ms + received_ms) // 2
+        logger.debug("Server clock offset: %d ms", self._clock_offset_ms)
+        return True
+    
+    def _start_keepalive(self):
+        """Start the keepalive thread on first use, unless the client is closed"""
+        with self._start_lock:
+            if self._keepalive_thread is None and not self._keepalive_stop.is_set():
+                self._keepalive_thread = threading.Thread(
+                    target=self._keepalive_loop, name='binance-keepalive', daemon=True
+                )
+                self._keepalive_thread.start()
+    
+    def _keepalive_loop(self):
+        """Keep the pooled connection warm and resync the server clock when due"""
+        while not self._keepalive_stop.wait(self.keepalive_interval):
+            now = time.monotonic()
+            if now - self._clock_synced_at >= self.clock_sync_interval:
+                self.sync_clock()
+            elif now - self._last_request >= self.keepalive_interval:
+                self.ping()
+    
+    def get_event_loop(self):
+        """
+        Get the loop shared by the order handlers, starting it on first use
+        
+        Its default executor is io_executor, so blocking calls made with
+        run_in_executor(None, ...) share the pooled connections.
+        
+        Returns:
+            EventLoopThread: Shared event loop
+        """
+        with self._event_loop_lock:
+            if self._event_loop is None:
+                self._event_loop = EventLoopThread('binance-loop', self.io_executor)
+            return self._event_loop
+    
+    def close(self):
+        """Stop the keepalive thread and shared event loop and release pooled connections"""
+        self._keepalive_stop.set()
+        with self._event_loop_lock:
+            event_loop, self._event_loop = self._event_loop, None
+        if event_loop is not None:
+            event_loop.stop()
+        if self._user_stream is not None:
+            self._user_stream.stop()
+        if self._ws_trade is not None:
+            self._ws_trade.disconnect()
+        self.io_executor.shutdown(wait=False)
+        self.session.close()
+    
+    def ping(self):
+        """Test connectivity to the REST API"""
+        return self._make_request('GET', '/fapi/v1/ping')
+    
     def get_server_time(self):
         """Get server time"""
         return self._make_request('GET', '/fapi/v1/time')
@@ -103,6 +481,35 @@ class BinanceClient:
         """Get exchange trading rules and symbol information"""
         return self._make_request('GET', '/fapi/v1/exchangeInfo')
     
+    def get_symbol_filters(self, symbol):
+        """
+        Get cached price tick size and quantity step size for a symbol
+        
+        Args:
+            symbol (str): Trading symbol
+        
+        Returns:
+            dict: {'tick_size': Decimal, 'step_size': Decimal} or None if unavailable
+        """
+        filters = self._symbol_filters.get(symbol)
+        if filters is not None:
+            return filters
+        
+        exchange_info = self.get_exchange_info()
+        if not exchange_info:
+            return None
+        
+        symbol_filters = {}
+        for symbol_info in exchange_info.get('symbols', []):
+            by_type = {f['filterType']: f for f in symbol_info.get('filters', [])}
+            if 'PRICE_FILTER' in by_type and 'LOT_SIZE' in by_type:
+                symbol_filters[symbol_info['symbol']] = {
+                    'tick_size': Decimal(by_type['PRICE_FILTER']['tickSize']),
+                    'step_size': Decimal(by_type['LOT_SIZE']['stepSize'])
+                }
+        self._symbol_filters = symbol_filters
+        return symbol_filters.get(symbol)
+    
     def get_ticker(self, symbol):
         """
         Get 24hr ticker price change statistics
@@ -116,6 +523,18 @@ class BinanceClient:
         params = {'symbol': symbol}
         return self._make_request('GET', '/fapi/v1/ticker/24hr', params)
     
+    async def get_ticker_async(self, symbol):
+        """
+        Awaitable get_ticker
+        
+        Args:
+            symbol (str): Trading symbol (e.g., 'BTCUSDT')
+        
+        Returns:
+            dict: Ticker data
+        """
+        return await self._make_request_async('GET', '/fapi/v1/ticker/24hr', {'symbol': symbol})
+    
     def get_orderbook(self, symbol, limit=100):
         """
         Get order book for symbol
@@ -220,6 +639,106 @@ class BinanceClient:
         logger.info(f"Placing order: {params}")
         return self._make_request('POST', '/fapi/v1/order', params, signed=True)
     
+    async def place_order_async(self, symbol, side, order_type, **kwargs):
+        """
+        Awaitable place_order
+        
+        Args:
+            symbol (str): Trading symbol
+            side (str): BUY or SELL
+            order_type (str): MARKET, LIMIT, STOP, TAKE_PROFIT, etc.
+            **kwargs: Additional order parameters
+        
+        Returns:
+            dict: Order response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.io_executor, lambda: self.place_order(symbol, side, order_type, **kwargs)
+        )
+    
+    def next_client_order_id(self, tag=''):
+        """
+        Generate a clientOrderId that is unique for this client
+        
+        Args:
+            tag (str): Short caller prefix, e.g. a grid tag
+        
+        Returns:
+            str: Client order ID
+        """
+        return f"{tag}{self._client_order_prefix}-{next(self._client_order_seq):x}"
+    
+    def encode_params(self, params):
+        """
+        URL-encode fixed order parameters once for reuse with place_order_encoded
+        
+        Args:
+            params (dict): Parameters shared by every order (symbol, type, ...)
+        
+        Returns:
+            str: Encoded query string prefix
+        """
+        return urlencode(params)
+    
+    def place_order_encoded(self, encoded_params, **kwargs):
+        """
+        Place new order from a pre-encoded parameter prefix
+        
+        Args:
+            encoded_params (str): Prefix from encode_params
+            **kwargs: Per-order parameters (side, price, ...)
+        
+        Returns:
+            dict: Order response
+        """
+        query_string = f"{encoded_params}&{urlencode(kwargs)}" if kwargs else encoded_params
+        logger.info(f"Placing order: {query_string}")
+        return self._make_signed_query('POST', '/fapi/v1/order', query_string)
+    
+    def place_orders_batch(self, orders):
+        """
+        Place up to 5 orders in a single signed request
+        
+        Args:
+            orders (list): Order parameter dicts (symbol, side, type, ...)
+        
+        Returns:
+            list: Per-order responses in submission order; failed entries
+                carry 'code' and 'msg' instead of an 'orderId'
+        """
+        params = {'batchOrders': _json_dumps(orders)}
+        logger.info(f"Placing batch of {len(orders)} orders")
+        return self._make_request('POST', '/fapi/v1/batchOrders', params, signed=True)
+    
+    def amend_order(self, symbol, side, quantity, price, order_id=None, orig_client_order_id=None):
+        """
+        Modify price/quantity of an open LIMIT order in place
+        
+        Args:
+            symbol (str): Trading symbol
+            side (str): Order side (must match the original order)
+            quantity (float): New order quantity
+            price (float): New limit price
+            order_id (int, optional): Order ID
+            orig_client_order_id (str, optional): Client order ID
+        
+        Returns:
+            dict: Modified order response
+        """
+        params = {
+            'symbol': symbol,
+            'side': side,
+            'quantity': quantity,
+            'price': price
+        }
+        if order_id:
+            params['orderId'] = order_id
+        if orig_client_order_id:
+            params['origClientOrderId'] = orig_client_order_id
+        
+        return self._make_request('PUT', '/fapi/v1/order', params, signed=True)
+    
     def cancel_order(self, symbol, order_id=None, orig_client_order_id=None):
         """
         Cancel order
@@ -242,6 +761,24 @@ class BinanceClient:
         logger.info(f"Cancelling order: {params}")
         return self._make_request('DELETE', '/fapi/v1/order', params, signed=True)
     
+    def cancel_orders_batch(self, symbol, order_ids):
+        """
+        Cancel up to 10 orders in a single signed request
+        
+        Args:
+            symbol (str): Trading symbol
+            order_ids (list): Order IDs to cancel
+        
+        Returns:
+            list: Per-order cancel responses in submission order
+        """
+        params = {
+            'symbol': symbol,
+            'orderIdList': _json_dumps(list(order_ids))
+        }
+        logger.info(f"Cancelling batch of {len(order_ids)} orders for {symbol}")
+        return self._make_request('DELETE', '/fapi/v1/batchOrders', params, signed=True)
+    
     def cancel_all_orders(self, symbol):
         """
         Cancel all open orders for symbol
@@ -277,6 +814,26 @@ class BinanceClient:
         
         return self._make_request('GET', '/fapi/v1/order', params, signed=True)
     
+    def recover_order(self, params):
+        """
+        Place an order whose earlier submission was not confirmed
+        
+        A lost or timed-out response doesn't mean the order wasn't placed, so it is
+        looked up by clientOrderId before it is sent again.
+        
+        Args:
+            params (dict): Order parameters including newClientOrderId
+        
+        Returns:
+            dict: Order response or None if failed
+        """
+        existing = self.get_order_status(
+            params['symbol'], orig_client_order_id=params['newClientOrderId']
+        )
+        if existing:
+            return existing
+        return self._make_request('POST', '/fapi/v1/order', dict(params), signed=True)
+    
     def set_leverage(self, symbol, leverage):
         """
         Change initial leverage
@@ -314,3 +871,30 @@ class BinanceClient:
         
         logger.info(f"Changing margin type for {symbol}: {margin_type}")
         return self._make_request('POST', '/fapi/v1/marginType', params, signed=True)
+    
+    def start_user_data_stream(self):
+        """
+        Create a listen key for the user data stream
+        
+        Returns:
+            dict: Response containing 'listenKey'
+        """
+        return self._make_request('POST', '/fapi/v1/listenKey')
+    
+    def keepalive_user_data_stream(self):
+        """
+        Extend the current listen key validity by 60 minutes
+        
+        Returns:
+            dict: Keepalive response
+        """
+        return self._make_request('PUT', '/fapi/v1/listenKey')
+    
+    def close_user_data_stream(self):
+        """
+        Close the current user data stream
+        
+        Returns:
+            dict: Close response
+        """
+        return self._make_request('DELETE', '/fapi/v1/listenKey')
@@ -10,6 +10,10 @@ from .logger import setup_logger
 
 logger = setup_logger()
 
+# Money columns are stored as float32 but summed as float64; float32 can't hold
+# cents at multi-million-dollar totals
+SUM_DTYPES = {'Size USD': 'float64', 'Closed PnL': 'float64'}
+
 class DataProcessor:
     def __init__(self):
         """Initialize data processor"""
@@ -41,6 +45,9 @@ class DataProcessor:
                 # Remove rows with invalid data
                 df = df.dropna(subset=['Timestamp', 'Size USD', 'Execution Price'])
                 
+                # Charting and aggregation columns don't need double precision
+                df = df.astype({'Size USD': 'float32', 'Closed PnL': 'float32'}, copy=False)
+                
                 # Convert timestamp to datetime - handle different timestamp formats
                 if not df.empty and not df['Timestamp'].isna().all():
                     # Convert scientific notation and determine units
@@ -59,6 +66,9 @@ class DataProcessor:
                             df['DateTime'] = pd.to_datetime(df['Timestamp'], unit='ms', errors='coerce')
                         except:
                             df['DateTime'] = pd.to_datetime(df['Timestamp'], unit='s', errors='coerce')
+                else:
+                    # Keep the column present so callers never need to re-parse
+                    df['DateTime'] = pd.to_datetime(df['Timestamp'], unit='ms', errors='coerce')
                 
                 self.historical_data = df
                 logger.info(f"Loaded {len(df)} historical trading records")
@@ -123,14 +133,17 @@ class DataProcessor:
             
             analysis = {}
             
+            self.historical_data['Date'] = self.historical_data['DateTime'].dt.date
+            data = self.historical_data.astype(SUM_DTYPES)
+            
             # Basic statistics
-            analysis['total_trades'] = len(self.historical_data)
-            analysis['total_volume_usd'] = self.historical_data['Size USD'].sum()
-            analysis['avg_trade_size'] = self.historical_data['Size USD'].mean()
-            analysis['total_pnl'] = self.historical_data['Closed PnL'].sum()
+            analysis['total_trades'] = len(data)
+            analysis['total_volume_usd'] = data['Size USD'].sum()
+            analysis['avg_trade_size'] = data['Size USD'].mean()
+            analysis['total_pnl'] = data['Closed PnL'].sum()
             
             # Performance by coin
-            coin_analysis = self.historical_data.groupby('Coin').agg({
+            coin_analysis = data.groupby('Coin').agg({
                 'Size USD': ['count', 'sum', 'mean'],
                 'Closed PnL': 'sum',
                 'Execution Price': ['min', 'max', 'mean']
@@ -138,8 +151,7 @@ class DataProcessor:
             analysis['coin_performance'] = coin_analysis
             
             # Time-based analysis
-            self.historical_data['Date'] = self.historical_data['DateTime'].dt.date
-            daily_stats = self.historical_data.groupby('Date').agg({
+            daily_stats = data.groupby('Date').agg({
                 'Size USD': 'sum',
                 'Closed PnL': 'sum',
                 'Account': 'count'
@@ -147,20 +159,20 @@ class DataProcessor:
             analysis['daily_performance'] = daily_stats
             
             # Side analysis (BUY vs SELL)
-            side_analysis = self.historical_data.groupby('Side').agg({
+            side_analysis = data.groupby('Side').agg({
                 'Size USD': ['count', 'sum', 'mean'],
                 'Closed PnL': 'sum'
             }).round(2)
             analysis['side_performance'] = side_analysis
             
             # Profit/Loss analysis
-            profitable_trades = self.historical_data[self.historical_data['Closed PnL'] > 0]
-            losing_trades = self.historical_data[self.historical_data['Closed PnL'] < 0]
+            profitable_trades = data[data['Closed PnL'] > 0]
+            losing_trades = data[data['Closed PnL'] < 0]
             
             analysis['profitability'] = {
                 'profitable_trades': len(profitable_trades),
                 'losing_trades': len(losing_trades),
-                'win_rate': len(profitable_trades) / len(self.historical_data) * 100,
+                'win_rate': len(profitable_trades) / len(data) * 100,
                 'avg_profit': profitable_trades['Closed PnL'].mean() if not profitable_trades.empty else 0,
                 'avg_loss': losing_trades['Closed PnL'].mean() if not losing_trades.empty else 0
             }
@@ -2,14 +2,20 @@
 Logging configuration for the trading bot
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 
 def setup_logger(name="trading_bot", log_file="bot.log", level=logging.INFO):
     """
     Set up logger with file and console handlers
     
+    Records are handed to the handlers through a queue and written by a
+    background listener thread, so logging never blocks on file or console I/O.
+    
     Args:
         name (str): Logger name
         log_file (str): Log file path
@@ -40,13 +46,20 @@ def setup_logger(name="trading_bot", log_file="bot.log", level=logging.INFO):
     file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
     file_handler.setLevel(level)
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.WARNING)  # Only warnings and errors to console
     console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
+    
+    # The calling thread only enqueues; the listener does the formatting and writes
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
     # Log the initialization
     logger.info("=" * 50)
@@ -70,16 +83,9 @@ def log_trade(logger, trade_type, symbol, side, quantity, price=None, order_id=N
         status (str): Trade status
     """
     
-    trade_info = {
-        'type': trade_type,
-        'symbol': symbol,
-        'side': side,
-        'quantity': quantity,
-        'price': price,
-        'order_id': order_id,
-        'status': status,
-        'timestamp': datetime.now().isoformat()
-    }
+    # Skip all formatting when trade logging is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     log_message = f"TRADE: {trade_type} {side} {quantity} {symbol}"
     if price:
@@ -89,7 +95,19 @@ def log_trade(logger, trade_type, symbol, side, quantity, price=None, order_id=N
     log_message += f" - {status}"
     
     logger.info(log_message)
-    logger.debug(f"Trade details: {trade_info}")
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        trade_info = {
+            'type': trade_type,
+            'symbol': symbol,
+            'side': side,
+            'quantity': quantity,
+            'price': price,
+            'order_id': order_id,
+            'status': status,
+            'timestamp': datetime.now().isoformat()
+        }
+        logger.debug("Trade details: %s", trade_info)
 
 def log_error(logger, error_type, error_message, additional_data=None):
     """
@@ -81,7 +81,7 @@ class TechnicalIndicators:
         
         return macd_line, signal_line, histogram
     
-    def bollinger_bands(self, data, period=20, std_dev=2):
+    def bollinger_bands(self, data, period=20, std_dev=2, middle_band=None):
         """
         Bollinger Bands
         
@@ -89,11 +89,13 @@ class TechnicalIndicators:
             data (pd.Series): Price data
             period (int): Period for moving average
             std_dev (float): Standard deviation multiplier
+            middle_band (pd.Series, optional): Precomputed SMA for the same period
         
         Returns:
             tuple: (Upper band, Middle band, Lower band)
         """
-        middle_band = self.sma(data, period)
+        if middle_band is None:
+            middle_band = self.sma(data, period)
         std = data.rolling(window=period).std()
         
         upper_band = middle_band + (std * std_dev)
@@ -143,6 +145,25 @@ class TechnicalIndicators:
         
         return wr
     
+    def true_range(self, high, low, close):
+        """
+        True Range
+        
+        Args:
+            high (pd.Series): High prices
+            low (pd.Series): Low prices
+            close (pd.Series): Close prices
+        
+        Returns:
+            pd.Series: True range values
+        """
+        prev_close = close.shift()
+        high_low = high - low
+        high_close = np.abs(high - prev_close)
+        low_close = np.abs(low - prev_close)
+        
+        return np.maximum(high_low, np.maximum(high_close, low_close))
+    
     def atr(self, high, low, close, period=14):
         """
         Average True Range
@@ -156,14 +177,7 @@ class TechnicalIndicators:
         Returns:
             pd.Series: ATR values
         """
-        high_low = high - low
-        high_close = np.abs(high - close.shift())
-        low_close = np.abs(low - close.shift())
-        
-        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-        atr = true_range.rolling(window=period).mean()
-        
-        return atr
+        return self.true_range(high, low, close).rolling(window=period).mean()
     
     def adx(self, high, low, close, period=14):
         """
@@ -184,10 +198,10 @@ class TechnicalIndicators:
         plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
         minus_dm = (-low_diff).where((low_diff > high_diff) & (low_diff > 0), 0)
         
-        tr = self.atr(high, low, close, 1)
+        tr_mean = self.true_range(high, low, close).rolling(window=period).mean()
         
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / tr.rolling(window=period).mean())
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / tr.rolling(window=period).mean())
+        plus_di = 100 * (plus_dm.rolling(window=period).mean() / tr_mean)
+        minus_di = 100 * (minus_dm.rolling(window=period).mean() / tr_mean)
         
         dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
         adx = dx.rolling(window=period).mean()
@@ -213,10 +227,10 @@ class TechnicalIndicators:
                 logger.error("DataFrame missing required OHLCV columns")
                 return {}
             
-            close = df['close']
-            high = df['high']
-            low = df['low']
-            volume = df['volume']
+            close = df['close'].astype(np.float64, copy=False)
+            high = df['high'].astype(np.float64, copy=False)
+            low = df['low'].astype(np.float64, copy=False)
+            volume = df['volume'].astype(np.float64, copy=False)
             
             # Moving Averages
             indicators['sma_10'] = self.sma(close, 10)
@@ -236,7 +250,7 @@ class TechnicalIndicators:
             indicators['macd_histogram'] = histogram
             
             # Bollinger Bands
-            bb_upper, bb_middle, bb_lower = self.bollinger_bands(close)
+            bb_upper, bb_middle, bb_lower = self.bollinger_bands(close, middle_band=indicators['sma_20'])
             indicators['bb_upper'] = bb_upper
             indicators['bb_middle'] = bb_middle
             indicators['bb_lower'] = bb_lower
@@ -3,11 +3,28 @@ WebSocket client for real-time market data from Binance
 """
 
 import websocket
+import itertools
 import json
 import threading
 import time
+from urllib.parse import urlencode
 from .logger import setup_logger
 
+# orjson is optional; market, order-update and WebSocket API frames are decoded per message
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
 logger = setup_logger()
 
 class WebSocketClient:
@@ -18,10 +35,11 @@ class WebSocketClient:
         Args:
             testnet (bool): Use testnet if True
         """
+        # Combined-stream endpoint, so every payload arrives wrapped with its stream name
         if testnet:
-            self.base_url = "wss://stream.binancefuture.com/ws/btcusdt@ticker"
+            self.base_url = "wss://stream.binancefuture.com/stream?streams=btcusdt@ticker"
         else:
-            self.base_url = "wss://fstream.binance.com/ws/btcusdt@ticker"
+            self.base_url = "wss://fstream.binance.com/stream?streams=btcusdt@ticker"
         
         self.ws = None
         self.is_running = False
@@ -71,7 +89,12 @@ class WebSocketClient:
             logger.info("WebSocket connection closed")
     
     def is_connected(self):
-        """Check if WebSocket is connected"""
+        """
+        Check if WebSocket is connected
+        
+        The flag is maintained by the on_open/on_close callbacks, so this
+        never touches the socket itself.
+        """
         return self.is_running
     
     def subscribe_ticker(self, symbol, callback=None):
@@ -120,6 +143,17 @@ class WebSocketClient:
         stream = f"{symbol.lower()}@aggTrade"
         self._subscribe(stream, callback)
     
+    def subscribe_book_ticker(self, symbol, callback=None):
+        """
+        Subscribe to best bid/ask updates, pushed on every book change
+        
+        Args:
+            symbol (str): Trading symbol
+            callback (function): Callback function for data
+        """
+        stream = f"{symbol.lower()}@bookTicker"
+        return self._subscribe(stream, callback)
+    
     def subscribe_mini_ticker_all(self, callback=None):
         """
         Subscribe to all symbols mini ticker
@@ -155,7 +189,7 @@ class WebSocketClient:
         }
         
         try:
-            self.ws.send(json.dumps(subscribe_msg))
+            self.ws.send(_json_dumps(subscribe_msg))
             logger.info(f"Subscribed to stream: {stream}")
             return True
         except Exception as e:
@@ -180,7 +214,7 @@ class WebSocketClient:
         }
         
         try:
-            self.ws.send(json.dumps(unsubscribe_msg))
+            self.ws.send(_json_dumps(unsubscribe_msg))
             
             # Remove from subscriptions and callbacks
             if stream in self.subscriptions:
@@ -208,7 +242,7 @@ class WebSocketClient:
             message (str): Received message
         """
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             
             # Handle subscription confirmations
             if 'result' in data:
@@ -229,7 +263,7 @@ class WebSocketClient:
                 
                 logger.debug(f"Received data for stream: {stream}")
             
-        except json.JSONDecodeError as e:
+        except _JSONDecodeError as e:
             logger.error(f"Failed to parse WebSocket message: {str(e)}")
         except Exception as e:
             logger.error(f"Error processing WebSocket message: {str(e)}")
@@ -270,3 +304,304 @@ class WebSocketClient:
                 logger.error(f"Failed to ping WebSocket: {str(e)}")
                 return False
         return False
+
+
+class UserDataStream:
+    def __init__(self, binance_client):
+        """
+        Initialize user data stream for order and account updates
+        
+        Args:
+            binance_client: Binance API client instance
+        """
+        self.client = binance_client
+        self.listeners = []
+        
+        if binance_client.testnet:
+            self.base_url = "wss://stream.binancefuture.com/ws/"
+        else:
+            self.base_url = "wss://fstream.binance.com/ws/"
+        
+        self.ws = None
+        self.listen_key = None
+        self.is_running = False
+        # Successful (re)connects; listeners compare it to spot gaps they must reconcile
+        self.connections = 0
+        self.keepalive_interval = 30 * 60  # Listen keys expire after 60 minutes
+        self._stop_event = threading.Event()
+        self.keepalive_thread = None
+    
+    def add_listener(self, callback):
+        """
+        Register a callback for decoded user data events
+        
+        Args:
+            callback (function): Called with each event dict
+        """
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+    
+    def start(self):
+        """
+        Obtain a listen key and open the user data stream
+        
+        Returns:
+            bool: True if connected, False otherwise
+        """
+        try:
+            response = self.client.start_user_data_stream()
+            if not response or 'listenKey' not in response:
+                logger.error("Failed to obtain user data stream listen key")
+                return False
+            
+            self.listen_key = response['listenKey']
+            self._stop_event.clear()
+            
+            self.ws = websocket.WebSocketApp(
+                self.base_url + self.listen_key,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error,
+                on_close=self._on_close
+            )
+            
+            self.ws_thread = threading.Thread(target=self.ws.run_forever, daemon=True)
+            self.ws_thread.start()
+            
+            # One keepalive loop survives reconnects
+            if self.keepalive_thread is None or not self.keepalive_thread.is_alive():
+                self.keepalive_thread = threading.Thread(target=self._keepalive_loop, daemon=True)
+                self.keepalive_thread.start()
+            
+            # Wait for connection to establish
+            timeout = 10
+            start_time = time.time()
+            while not self.is_running and (time.time() - start_time) < timeout:
+                time.sleep(0.1)
+            
+            if self.is_running:
+                self.connections += 1
+                logger.info("User data stream connected")
+                return True
+            else:
+                logger.error("User data stream connection timeout")
+                return False
+                
+        except Exception as e:
+            logger.error(f"Failed to start user data stream: {str(e)}")
+            return False
+    
+    def stop(self):
+        """Close the user data stream and release the listen key"""
+        self._stop_event.set()
+        if self.ws:
+            self.is_running = False
+            self.ws.close()
+        if self.listen_key:
+            self.client.close_user_data_stream()
+            self.listen_key = None
+        logger.info("User data stream closed")
+    
+    def _keepalive_loop(self):
+        """Refresh the listen key until the stream is stopped"""
+        while not self._stop_event.wait(self.keepalive_interval):
+            if not self.client.keepalive_user_data_stream():
+                logger.error("Failed to keep user data stream alive")
+    
+    def _on_open(self, ws):
+        """WebSocket on_open callback"""
+        self.is_running = True
+    
+    def _on_message(self, ws, message):
+        """
+        WebSocket on_message callback
+        
+        Args:
+            ws: WebSocket instance
+            message (str): Received message
+        """
+        try:
+            data = _json_loads(message)
+            if 'e' in data:
+                for callback in self.listeners:
+                    try:
+                        callback(data)
+                    except Exception as e:
+                        logger.error(f"User data listener error: {str(e)}")
+        except _JSONDecodeError as e:
+            logger.error(f"Failed to parse user data message: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error processing user data event: {str(e)}")
+    
+    def _on_error(self, ws, error):
+        """WebSocket on_error callback"""
+        logger.error(f"User data stream error: {str(error)}")
+    
+    def _on_close(self, ws, close_status_code=None, close_msg=None):
+        """WebSocket on_close callback"""
+        self.is_running = False
+        logger.info(f"User data stream closed: {close_status_code} - {close_msg}")
+
+
+class WsTradeSession:
+    def __init__(self, binance_client):
+        """
+        Initialize an authenticated session on the Futures WebSocket API
+        
+        Args:
+            binance_client: Binance API client instance, used for credentials and signing
+        """
+        self.client = binance_client
+        
+        if binance_client.testnet:
+            self.url = "wss://testnet.binancefuture.com/ws-fapi/v1"
+        else:
+            self.url = "wss://ws-fapi.binance.com/ws-fapi/v1"
+        
+        self.ws = None
+        self.is_running = False
+        self._request_ids = itertools.count(1)
+        self._pending = {}  # request id -> [threading.Event, response]
+    
+    def connect(self):
+        """
+        Open the WebSocket API connection
+        
+        Returns:
+            bool: True if connected, False otherwise
+        """
+        try:
+            self.ws = websocket.WebSocketApp(
+                self.url,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error,
+                on_close=self._on_close
+            )
+            
+            self.ws_thread = threading.Thread(target=self.ws.run_forever, daemon=True)
+            self.ws_thread.start()
+            
+            # Wait for connection to establish
+            timeout = 10
+            start_time = time.time()
+            while not self.is_running and (time.time() - start_time) < timeout:
+                time.sleep(0.1)
+            
+            if self.is_running:
+                logger.info("WebSocket trade session connected")
+                return True
+            else:
+                logger.error("WebSocket trade session connection timeout")
+                return False
+                
+        except Exception as e:
+            logger.error(f"Failed to connect WebSocket trade session: {str(e)}")
+            return False
+    
+    def disconnect(self):
+        """Close the WebSocket API connection"""
+        if self.ws:
+            self.is_running = False
+            self.ws.close()
+    
+    def send(self, method, params):
+        """
+        Sign and send a request without waiting for the response
+        
+        Args:
+            method (str): WebSocket API method, e.g. 'order.place'
+            params (dict): Request parameters
+        
+        Returns:
+            int: Request ID to pass to wait(), or None if sending failed
+        """
+        params = dict(params, apiKey=self.client.api_key, timestamp=self.client.timestamp_ms())
+        
+        # The WebSocket API signs parameters sorted by name
+        params['signature'] = self.client._sign(urlencode(sorted(params.items())))
+        
+        request_id = next(self._request_ids)
+        self._pending[request_id] = [threading.Event(), None]
+        
+        try:
+            self.ws.send(_json_dumps({'id': request_id, 'method': method, 'params': params}))
+            return request_id
+        except Exception as e:
+            self._pending.pop(request_id, None)
+            logger.error(f"Failed to send {method}: {str(e)}")
+            return None
+    
+    def wait(self, request_id, timeout=5):
+        """
+        Wait for the response to a sent request
+        
+        Args:
+            request_id (int): ID returned by send()
+            timeout (float): Seconds to wait for the response
+        
+        Returns:
+            dict: Request result, or None on error or timeout
+        """
+        entry = self._pending.get(request_id)
+        if entry is None:
+            return None
+        
+        entry[0].wait(timeout)
+        self._pending.pop(request_id, None)
+        
+        response = entry[1]
+        if response is None:
+            logger.error(f"WebSocket API request {request_id} timed out")
+            return None
+        if response.get('status') != 200:
+            logger.error(f"WebSocket API error response: {response.get('error')}")
+            return None
+        return response.get('result')
+    
+    def request(self, method, params, timeout=5):
+        """
+        Send a request and wait for its result
+        
+        Args:
+            method (str): WebSocket API method
+            params (dict): Request parameters
+            timeout (float): Seconds to wait for the response
+        
+        Returns:
+            dict: Request result, or None on error or timeout
+        """
+        request_id = self.send(method, params)
+        if request_id is None:
+            return None
+        return self.wait(request_id, timeout)
+    
+    def _on_open(self, ws):
+        """WebSocket on_open callback"""
+        self.is_running = True
+    
+    def _on_message(self, ws, message):
+        """
+        WebSocket on_message callback
+        
+        Args:
+            ws: WebSocket instance
+            message (str): Received message
+        """
+        try:
+            data = _json_loads(message)
+            entry = self._pending.get(data.get('id'))
+            if entry is not None:
+                entry[1] = data
+                entry[0].set()
+        except _JSONDecodeError as e:
+            logger.error(f"Failed to parse WebSocket API message: {str(e)}")
+    
+    def _on_error(self, ws, error):
+        """WebSocket on_error callback"""
+        logger.error(f"WebSocket trade session error: {str(error)}")
+    
+    def _on_close(self, ws, close_status_code=None, close_msg=None):
+        """WebSocket on_close callback"""
+        self.is_running = False
+        logger.info(f"WebSocket trade session closed: {close_status_code} - {close_msg}")